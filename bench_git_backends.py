@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Git Backend Benchmark
+Times the git part of project initialization (clone, fresh init, add, commit)
+for each available git backend against a local template repository.
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import argparse
+import subprocess
+
+from project_initializer import GIT_BACKENDS, Initializer, get_git_backend
+
+
+def create_template_repository(path, file_count):
+    """Create a local git repository that stands in for the boilerplate template."""
+    os.makedirs(path)
+    for i in range(file_count):
+        sub_dir = os.path.join(path, f"module{i % 10}")
+        os.makedirs(sub_dir, exist_ok=True)
+        with open(os.path.join(sub_dir, f"file{i}.txt"), 'w') as f:
+            f.write(f"template file {i}\n" * 20)
+    for name in ['README.md', 'bootstrap.sh', 'bootstrap.bat']:
+        with open(os.path.join(path, name), 'w') as f:
+            f.write(f"{name}\n")
+    env = dict(os.environ, GIT_AUTHOR_NAME="bench", GIT_AUTHOR_EMAIL="bench@localhost",
+               GIT_COMMITTER_NAME="bench", GIT_COMMITTER_EMAIL="bench@localhost")
+    for args in (['init'], ['add', '.'], ['commit', '-m', 'template']):
+        subprocess.run(['git'] + args, cwd=path, check=True, capture_output=True, env=env)
+
+
+def benchmark_backend(backend, template_dir, work_dir, runs):
+    """Return the per-run timings of Initializer.initialize() (without bootstrap) with the given backend."""
+    session = Initializer(template_dir, git_backend=backend)
+    session.check_system()  # Warm the session, as a long-lived embedder would
+    timings = []
+    for i in range(runs):
+        start = time.perf_counter()
+        result = session.initialize(f"{backend.name}-{i}", work_dir, bootstrap=False)
+        timings.append(time.perf_counter() - start)
+        if not result.success:
+            raise RuntimeError(f"Initialization failed with the {backend.name} backend: {result.error}")
+        shutil.rmtree(result.project_dir, ignore_errors=True)
+    return timings
+
+
+def main():
+    """Run the benchmark for every available git backend and print a summary."""
+    parser = argparse.ArgumentParser(description="Benchmark the available git backends.")
+    parser.add_argument('--runs', type=int, default=5, help='Number of initializations per backend (default: 5)')
+    parser.add_argument('--files', type=int, default=200, help='Number of files in the template (default: 200)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        template_dir = os.path.join(tmp, "template")
+        create_template_repository(template_dir, args.files)
+
+        print(f"Template: {args.files + 3} files, {args.runs} runs per backend")
+        print(f"{'backend':<12}{'mean':>10}{'min':>10}{'max':>10}")
+        for name in sorted(GIT_BACKENDS):
+            backend = get_git_backend(name)
+            if not backend.is_available():
+                print(f"{name:<12}{'not available':>30}")
+                continue
+            timings = benchmark_backend(backend, template_dir, tmp, args.runs)
+            mean = sum(timings) / len(timings)
+            print(f"{name:<12}{mean * 1000:>8.1f}ms{min(timings) * 1000:>8.1f}ms{max(timings) * 1000:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
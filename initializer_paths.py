@@ -0,0 +1,18 @@
+"""
+Project Initializer Paths
+Locations shared by the command line and GUI versions. This module only uses
+the standard library's os and platform modules, so the GUI can import it
+without slowing down its start.
+"""
+
+import os
+import platform
+
+
+def get_cache_home():
+    """Return the per-user cache directory for the project initializer."""
+    if platform.system().lower() == "windows":
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser(r'~\AppData\Local')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(base, 'project-initializer')
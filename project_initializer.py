@@ -11,117 +11,1253 @@ import subprocess
 import platform
 import shutil
 import argparse
+import io
+import json
+import hashlib
+import concurrent.futures
+import codecs
+import random
+import select
+import signal
+import stat
+import threading
+import time
+import queue
+import tempfile
 from pathlib import Path
 
+from initializer_paths import get_cache_home
 
-def check_git_installed():
-    """Check if git is installed and available in PATH."""
+
+class WatchdogTimeout(Exception):
+    """Raised when a child process misses its deadline or stops making progress."""
+
+    def __init__(self, message, reason):
+        super().__init__(message)
+        self.reason = reason  # 'deadline' or 'stall'
+
+
+class OperationCancelled(Exception):
+    """Raised when a child process is stopped because its result is no longer needed."""
+
+
+class PhaseLimits:
+    """Deadline and stall timeout, in seconds, for one phase (None disables either)."""
+
+    def __init__(self, deadline=None, stall_timeout=None):
+        self.deadline = deadline
+        self.stall_timeout = stall_timeout
+
+
+# Network phases are retried on failure; bootstrap is not, since it is not idempotent
+DEFAULT_PHASE_LIMITS = {
+    'clone': PhaseLimits(deadline=600, stall_timeout=120),
+    'fetch': PhaseLimits(deadline=60, stall_timeout=120),
+    'bootstrap': PhaseLimits(deadline=1800, stall_timeout=120),
+}
+
+# Longest wait, shared by both output readers, for the pipes to drain after the child exits
+READER_DRAIN_SECONDS = 2.0
+
+DEFAULT_RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+
+
+def build_phase_limits(stall_timeout=None, clone_deadline=None, bootstrap_deadline=None):
+    """Return phase limits with the given overrides applied (0 disables a limit)."""
+    def pick(value, default):
+        if value is None:
+            return default
+        return value or None
+    
+    return {
+        phase: PhaseLimits(
+            deadline=pick({'clone': clone_deadline, 'bootstrap': bootstrap_deadline}.get(phase), limits.deadline),
+            stall_timeout=pick(stall_timeout, limits.stall_timeout),
+        )
+        for phase, limits in DEFAULT_PHASE_LIMITS.items()
+    }
+
+
+def kill_process_group(proc):
+    """Kill a child started by run_with_watchdog() together with everything it spawned."""
     try:
-        subprocess.run(['git', '--version'], check=True, capture_output=True)
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+        if platform.system().lower() == "windows":
+            subprocess.run(['taskkill', '/F', '/T', '/PID', str(proc.pid)], capture_output=True)
+        else:
+            os.killpg(proc.pid, signal.SIGKILL)
+    except (OSError, subprocess.SubprocessError):
+        pass
+    try:
+        proc.kill()
+    except OSError:
+        pass
+
+
+def run_with_watchdog(args, limits=None, watch_dir=None, on_output=None, description=None,
+                      cwd=None, shell=False, check=True, cancel_event=None, env=None):
+    """Run a command with a deadline and a stall detector.
 
+    The child runs in its own process group. Its output is captured (and
+    passed to on_output as it arrives, if given). The child counts as
+    stalled once it has produced no output for limits.stall_timeout seconds
+    and, if watch_dir is given, the file count and size under watch_dir have
+    not changed either. On a stall or a missed deadline the whole process
+    group is killed and WatchdogTimeout is raised. Setting cancel_event
+    kills it the same way and raises OperationCancelled.
 
-def clone_repository(repo_url, target_dir):
-    """Clone the repository to the target directory."""
-    print(f"Cloning repository from {repo_url}...")
+    Once the child exits, only the output already in the pipes is collected.
+    Background processes it left behind may still hold the pipes, and they
+    are not waited for.
+    """
+    limits = limits or PhaseLimits()
+    description = description or (args if isinstance(args, str) else ' '.join(args))
+    if platform.system().lower() == "windows":
+        group_kwargs = {'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP}
+    else:
+        group_kwargs = {'start_new_session': True}
+    proc = subprocess.Popen(args, cwd=cwd, shell=shell, env=env, stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE, **group_kwargs)
+    
+    start = time.monotonic()
+    last_activity = [start]
+    output = {'stdout': [], 'stderr': []}
+    
+    # Writing to this pipe tells the readers the child has exited: they read
+    # what is left and close their end instead of waiting for EOF. Pipes
+    # cannot be select()ed on Windows, where the readers always wait for EOF.
+    if platform.system().lower() == "windows":
+        wake_r = wake_w = None
+    else:
+        wake_r, wake_w = os.pipe()
+    
+    def pump(stream, name):
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        fd = stream.fileno()
+        try:
+            while True:
+                if wake_r is not None and fd not in select.select([fd, wake_r], [], [])[0]:
+                    break  # child exited and the pipe is drained
+                data = os.read(fd, 65536)
+                if not data:
+                    break
+                last_activity[0] = time.monotonic()
+                text = decoder.decode(data)
+                output[name].append(text)
+                if on_output and text:
+                    on_output(text)
+        finally:
+            stream.close()
     
-    # Ensure target_dir is a proper path
-    if not os.path.isabs(target_dir):
-        # If it's a relative path, make it absolute relative to current directory
-        target_dir = os.path.abspath(target_dir)
+    # A waiter thread lets the loop below wake up the moment the child exits,
+    # instead of polling with Popen.wait(timeout)
+    exited = threading.Event()
     
-    print(f"Target directory: {target_dir}")
+    def wait_for_exit():
+        proc.wait()
+        exited.set()
     
-    if os.path.exists(target_dir):
-        print(f"Directory {target_dir} already exists. Removing it...")
+    readers = [threading.Thread(target=pump, args=(proc.stdout, 'stdout'), daemon=True),
+               threading.Thread(target=pump, args=(proc.stderr, 'stderr'), daemon=True)]
+    for thread in readers + [threading.Thread(target=wait_for_exit, daemon=True)]:
+        thread.start()
+    
+    poll_interval = min(0.5, limits.stall_timeout / 4) if limits.stall_timeout else 0.5
+    if cancel_event is not None:
+        poll_interval = min(poll_interval, 0.05)
+    # Only re-measured after a silent period, so large trees are rarely walked
+    fs_signature = measure_tree(watch_dir) if watch_dir and limits.stall_timeout else None
+    try:
+        while not exited.wait(poll_interval):
+            if cancel_event is not None and cancel_event.is_set():
+                raise OperationCancelled(f"{description} was cancelled")
+            now = time.monotonic()
+            if limits.deadline and now - start > limits.deadline:
+                raise WatchdogTimeout(f"{description} exceeded its {limits.deadline}s deadline", 'deadline')
+            if limits.stall_timeout and now - last_activity[0] > limits.stall_timeout:
+                if watch_dir:
+                    signature = measure_tree(watch_dir)
+                    if signature != fs_signature:
+                        fs_signature = signature
+                        last_activity[0] = now
+                        continue
+                progress = "output or filesystem progress" if watch_dir else "output"
+                raise WatchdogTimeout(f"{description} stalled: no {progress} for "
+                                      f"{limits.stall_timeout}s", 'stall')
+    except BaseException:
+        kill_process_group(proc)
+        proc.wait()
+        raise
+    finally:
+        if wake_w is not None:
+            os.write(wake_w, b'x')
+        drain_deadline = time.monotonic() + READER_DRAIN_SECONDS
+        for reader in readers:
+            reader.join(max(0.0, drain_deadline - time.monotonic()))
+        if wake_r is not None and not any(reader.is_alive() for reader in readers):
+            os.close(wake_r)
+            os.close(wake_w)
+    
+    stdout, stderr = ''.join(output['stdout']), ''.join(output['stderr'])
+    if check and proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, args, stdout, stderr)
+    return subprocess.CompletedProcess(args, proc.returncode, stdout, stderr)
+
+
+class RetryEvent:
+    """One failed attempt that was retried."""
+
+    def __init__(self, phase, attempt, error, delay):
+        self.phase = phase
+        self.attempt = attempt
+        self.error = error
+        self.delay = delay
+
+    def __str__(self):
+        return f"{self.phase} attempt {self.attempt} failed ({self.error}); retried after {self.delay:.1f}s"
+
+
+def retry_with_backoff(operation, phase, attempts=DEFAULT_RETRY_ATTEMPTS, retry_on=(Exception,),
+                       on_retry=None, base_delay=RETRY_BASE_DELAY, max_delay=RETRY_MAX_DELAY):
+    """Call operation(), retrying failures with jittered exponential backoff.
+
+    Delays use "full jitter": a random value between 0 and
+    min(max_delay, base_delay * 2 ** (attempt - 1)), so concurrent retries
+    do not hit a struggling server in lockstep. on_retry(RetryEvent) is
+    called before each sleep.
+    """
+    for attempt in range(1, attempts + 1):
+        try:
+            return operation()
+        except retry_on as e:
+            if attempt == attempts:
+                raise
+            delay = random.uniform(0, min(max_delay, base_delay * 2 ** (attempt - 1)))
+            if on_retry:
+                on_retry(RetryEvent(phase, attempt, e, delay))
+            time.sleep(delay)
+
+
+class GitBackendError(Exception):
+    """Raised when a git backend operation fails."""
+
+    def __init__(self, message, stderr=None):
+        super().__init__(message)
+        self.stderr = stderr
+
+
+class GitBackend:
+    """Interface for the git operations used during project initialization."""
+
+    name = "base"
+
+    def is_available(self):
+        """Return True if this backend can be used on this system."""
+        raise NotImplementedError
+
+    def clone(self, repo_url, target_dir, bare=False):
+        """Clone repo_url into target_dir (without a work tree if bare)."""
+        raise NotImplementedError
+
+    def fetch(self, repo_dir, repo_url):
+        """Update the branches of the bare repository repo_dir from repo_url."""
+        raise NotImplementedError
+
+    def init(self, target_dir):
+        """Initialize a new repository in target_dir."""
+        raise NotImplementedError
+
+    def add_all(self, target_dir):
+        """Stage every file in target_dir."""
+        raise NotImplementedError
+
+    def commit(self, target_dir, message):
+        """Create a commit of the staged files in target_dir."""
+        raise NotImplementedError
+
+    def ls_remote(self, repo_url, timeout=None, cancel_event=None):
+        """Return a dict mapping remote HEAD and branch refs to commit SHAs.
+
+        Backends that can interrupt the query stop early once cancel_event is set.
+        """
+        raise NotImplementedError
+
+    def head_commit(self, target_dir):
+        """Return the SHA of the commit checked out in target_dir."""
+        raise NotImplementedError
+
+    def restore_files(self, target_dir, paths):
+        """Restore the given work tree paths in target_dir from HEAD."""
+        raise NotImplementedError
+
+    def ls_tree(self, repo_dir, commit):
+        """Return {path: blob SHA} for the regular files in commit's tree."""
+        raise NotImplementedError
+
+    def count_commits(self, repo_dir, base, tip):
+        """Return the number of commits reachable from tip but not from base."""
+        raise NotImplementedError
+
+    def hash_files(self, repo_dir, paths):
+        """Return the blob SHAs git would store for the given work tree paths of repo_dir.
+
+        Paths are '/'-separated and relative to repo_dir. Line-ending
+        conversion (core.autocrlf, .gitattributes) is applied as it would be
+        by `git add`, so untouched checkouts match the committed blobs.
+        """
+        raise NotImplementedError
+
+
+class SubprocessGitBackend(GitBackend):
+    """Git backend that runs the git command line tool."""
+
+    name = "subprocess"
+
+    def __init__(self, phase_limits=None, env=None):
+        self.phase_limits = phase_limits or DEFAULT_PHASE_LIMITS
+        self.env = env
+
+    def _run(self, args, cwd=None, limits=None, watch_dir=None, cancel_event=None, input=None):
+        """Run git; network phases (given limits) run under the stall watchdog."""
         try:
-            shutil.rmtree(target_dir)
-        except PermissionError as e:
-            print(f"Error: Cannot remove existing directory {target_dir}: {e}")
-            print("Please close any applications using this directory and try again.")
+            if limits:
+                return run_with_watchdog(['git'] + args, limits, watch_dir=watch_dir,
+                                         description=f"git {args[0]}", cwd=cwd,
+                                         cancel_event=cancel_event, env=self.env)
+            return subprocess.run(['git'] + args, cwd=cwd, check=True, env=self.env,
+                                  capture_output=True, text=True, input=input)
+        except subprocess.CalledProcessError as e:
+            raise GitBackendError(str(e), e.stderr)
+        except WatchdogTimeout as e:
+            raise GitBackendError(f"Timeout: {e}")
+        except OperationCancelled as e:
+            raise GitBackendError(str(e))
+        except FileNotFoundError as e:
+            raise GitBackendError(f"Git executable not found: {e}")
+
+    def is_available(self):
+        try:
+            self._run(['--version'])
+            return True
+        except GitBackendError:
             return False
+
+    def clone(self, repo_url, target_dir, bare=False):
+        # --progress keeps git writing to the pipe, which the stall detector watches
+        self._run(['clone', '--progress', '--verbose'] + (['--bare'] if bare else []) + [repo_url, target_dir],
+                  limits=self.phase_limits['clone'], watch_dir=target_dir)
+
+    def fetch(self, repo_dir, repo_url):
+        self._run(['fetch', '--progress', '--prune', repo_url, '+refs/heads/*:refs/heads/*'], cwd=repo_dir,
+                  limits=self.phase_limits['fetch'], watch_dir=repo_dir)
+
+    def init(self, target_dir):
+        self._run(['init'], cwd=target_dir)
+
+    def add_all(self, target_dir):
+        self._run(['add', '.'], cwd=target_dir)
+
+    def commit(self, target_dir, message):
+        self._run(['commit', '-m', message], cwd=target_dir)
+
+    def ls_remote(self, repo_url, timeout=None, cancel_event=None):
+        limits = self.phase_limits['fetch']
+        if timeout is not None:
+            limits = PhaseLimits(deadline=timeout, stall_timeout=limits.stall_timeout)
+        result = self._run(['ls-remote', repo_url, 'HEAD', 'refs/heads/*'], limits=limits,
+                           cancel_event=cancel_event)
+        refs = {}
+        for line in result.stdout.splitlines():
+            if '\t' in line:
+                sha, ref = line.split('\t', 1)
+                refs[ref] = sha
+        return refs
+
+    def head_commit(self, target_dir):
+        return self._run(['rev-parse', 'HEAD'], cwd=target_dir).stdout.strip()
+
+    def restore_files(self, target_dir, paths):
+        self._run(['checkout', 'HEAD', '--'] + list(paths), cwd=target_dir)
+
+    def ls_tree(self, repo_dir, commit):
+        result = self._run(['ls-tree', '-r', '-z', commit], cwd=repo_dir)
+        blobs = {}
+        for entry in result.stdout.split('\0'):
+            if not entry:
+                continue
+            info, path = entry.split('\t', 1)
+            mode, obj_type, sha = info.split()
+            if obj_type == 'blob' and mode in ('100644', '100755'):
+                blobs[path] = sha
+        return blobs
+
+    def count_commits(self, repo_dir, base, tip):
+        return int(self._run(['rev-list', '--count', f"{base}..{tip}"], cwd=repo_dir).stdout.strip())
+
+    def hash_files(self, repo_dir, paths):
+        if not paths:
+            return []
+        # One git process per project; filters are chosen by each path's attributes and config
+        result = self._run(['hash-object', '--stdin-paths'], cwd=repo_dir, input=''.join(p + '\n' for p in paths))
+        return result.stdout.split()
+
+
+class DulwichGitBackend(GitBackend):
+    """In-process git backend built on dulwich (used only if it is installed)."""
+
+    name = "dulwich"
+
+    def _porcelain(self):
+        try:
+            from dulwich import porcelain
+        except ImportError:
+            raise GitBackendError("dulwich is not installed (pip install dulwich)")
+        return porcelain
+
+    def _call(self, func, *args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except GitBackendError:
+            raise
         except Exception as e:
-            print(f"Error removing directory: {e}")
+            raise GitBackendError(f"{type(e).__name__}: {e}")
+
+    def is_available(self):
+        try:
+            self._porcelain()
+            return True
+        except GitBackendError:
             return False
+
+    def clone(self, repo_url, target_dir, bare=False):
+        porcelain = self._porcelain()
+        repo = self._call(porcelain.clone, repo_url, target_dir, bare=bare, checkout=not bare,
+                          errstream=io.BytesIO())
+        repo.close()
+
+    def fetch(self, repo_dir, repo_url):
+        from dulwich.repo import Repo
+        porcelain = self._porcelain()
+        repo = self._call(Repo, repo_dir)
+        try:
+            result = self._call(porcelain.fetch, repo, repo_url, errstream=io.BytesIO())
+            for ref, sha in result.refs.items():
+                if ref.startswith(b'refs/heads/') and sha is not None:
+                    repo.refs[ref] = sha
+        finally:
+            repo.close()
+
+    def init(self, target_dir):
+        porcelain = self._porcelain()
+        repo = self._call(porcelain.init, target_dir)
+        repo.close()
+
+    def add_all(self, target_dir):
+        # porcelain.add() without paths resolves them against the current
+        # working directory, so pass every file explicitly instead.
+        porcelain = self._porcelain()
+        paths = []
+        for root, dirs, files in os.walk(target_dir):
+            dirs[:] = [d for d in dirs if d != '.git']
+            paths.extend(os.path.join(root, name) for name in files)
+        self._call(porcelain.add, target_dir, paths=paths)
+
+    def commit(self, target_dir, message):
+        porcelain = self._porcelain()
+        self._call(porcelain.commit, target_dir, message=message.encode('utf-8'))
+
+    def ls_remote(self, repo_url, timeout=None, cancel_event=None):
+        porcelain = self._porcelain()
+        result = self._call(porcelain.ls_remote, repo_url)
+        # Newer dulwich versions wrap the refs in an LsRemoteResult
+        result = getattr(result, 'refs', result)
+        refs = {}
+        for ref, sha in result.items():
+            ref = ref.decode('utf-8') if isinstance(ref, bytes) else ref
+            if not (ref == 'HEAD' or ref.startswith('refs/heads/')) or sha is None:
+                continue
+            refs[ref] = sha.decode('ascii') if isinstance(sha, bytes) else sha
+        return refs
+
+    def head_commit(self, target_dir):
+        from dulwich.repo import Repo
+        repo = self._call(Repo, target_dir)
+        try:
+            return repo.head().decode('ascii')
+        finally:
+            repo.close()
+
+    def restore_files(self, target_dir, paths):
+        # Files are written straight from the HEAD tree so only the given
+        # paths are touched, unlike a hard reset of the whole work tree.
+        from dulwich.repo import Repo
+        from dulwich.object_store import tree_lookup_path
+        repo = self._call(Repo, target_dir)
+        try:
+            tree_id = repo[repo.head()].tree
+            for path in paths:
+                mode, sha = self._call(tree_lookup_path, repo.__getitem__, tree_id,
+                                       path.replace(os.sep, '/').encode('utf-8'))
+                full_path = os.path.join(target_dir, path)
+                os.makedirs(os.path.dirname(full_path), exist_ok=True)
+                with open(full_path, 'wb') as f:
+                    f.write(repo[sha].as_raw_string())
+                if mode & 0o111:
+                    os.chmod(full_path, 0o755)
+        finally:
+            repo.close()
+
+    def ls_tree(self, repo_dir, commit):
+        from dulwich.repo import Repo
+        try:
+            from dulwich.object_store import iter_tree_contents
+        except ImportError:  # dulwich < 0.21
+            iter_tree_contents = None
+        repo = self._call(Repo, repo_dir)
+        try:
+            tree_id = self._call(repo.__getitem__, commit.encode('ascii')).tree
+            if iter_tree_contents:
+                entries = iter_tree_contents(repo.object_store, tree_id)
+            else:
+                entries = repo.object_store.iter_tree_contents(tree_id)
+            return {
+                entry.path.decode('utf-8'): entry.sha.decode('ascii')
+                for entry in entries
+                if entry.mode in (0o100644, 0o100755)
+            }
+        finally:
+            repo.close()
+
+    def count_commits(self, repo_dir, base, tip):
+        from dulwich.repo import Repo
+        repo = self._call(Repo, repo_dir)
+        try:
+            walker = self._call(repo.get_walker, include=[tip.encode('ascii')], exclude=[base.encode('ascii')])
+            return sum(1 for _ in walker)
+        finally:
+            repo.close()
+
+    def hash_files(self, repo_dir, paths):
+        from dulwich.errors import NotGitRepository
+        from dulwich.objects import Blob
+        from dulwich.repo import Repo
+        try:
+            repo = Repo(repo_dir)
+        except NotGitRepository:
+            # No repository config or attributes to apply
+            return [git_blob_sha(os.path.join(repo_dir, *path.split('/'))) for path in paths]
+        try:
+            normalizer = self._call(repo.get_blob_normalizer)
+            shas = []
+            for path in paths:
+                with open(os.path.join(repo_dir, *path.split('/')), 'rb') as f:
+                    blob = Blob.from_string(f.read())
+                blob = self._call(normalizer.checkin_normalize, blob, path.encode('utf-8'))
+                shas.append(blob.id.decode('ascii'))
+            return shas
+        finally:
+            repo.close()
+
+
+GIT_BACKENDS = {
+    SubprocessGitBackend.name: SubprocessGitBackend,
+    DulwichGitBackend.name: DulwichGitBackend,
+}
+
+
+def get_git_backend(name="subprocess", phase_limits=None, env=None):
+    """Return a git backend instance by name ('subprocess', 'dulwich' or 'auto').
+
+    'auto' prefers the in-process dulwich backend when it is installed and
+    falls back to the git command line tool otherwise. phase_limits only
+    applies to the subprocess backend; in-process operations cannot be
+    killed, so dulwich runs without deadlines. env is the environment for
+    git child processes (None inherits this process's environment).
+    """
+    if name == "auto":
+        backend = DulwichGitBackend()
+        return backend if backend.is_available() else SubprocessGitBackend(phase_limits, env)
+    if name == SubprocessGitBackend.name:
+        return SubprocessGitBackend(phase_limits, env)
+    if name not in GIT_BACKENDS:
+        raise ValueError(f"Unknown git backend: {name}")
+    return GIT_BACKENDS[name]()
+
+
+def check_git_installed(git_backend=None):
+    """Check if git is installed and available in PATH."""
+    git_backend = git_backend or SubprocessGitBackend()
+    return git_backend.is_available()
+
+
+def commit_matches(commit, expected_commit):
+    """Return True if commit is expected_commit, which may be abbreviated or in any case."""
+    return commit.lower().startswith(expected_commit.lower())
+
+
+class TemplateIntegrityError(Exception):
+    """Raised when a cached or materialized template cannot be verified or repaired."""
+
+
+def hash_file(path):
+    """Return the SHA-256 hex digest of a file."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def iter_template_files(root_dir):
+    """Yield the relative (forward slash) paths of all files under root_dir, skipping .git."""
+    for root, dirs, files in os.walk(root_dir):
+        dirs[:] = [d for d in dirs if d != '.git']
+        for name in files:
+            full_path = os.path.join(root, name)
+            yield os.path.relpath(full_path, root_dir).replace(os.sep, '/')
+
+
+def build_manifest(root_dir, max_workers=None):
+    """Build a manifest of {relative path: [size, mtime_ns, sha256]} for a template tree.
+
+    Files are hashed across a thread pool; hashlib releases the GIL while
+    hashing so large templates scale with the number of cores.
+    """
+    rel_paths = list(iter_template_files(root_dir))
+    full_paths = [os.path.join(root_dir, *p.split('/')) for p in rel_paths]
+    stats = [os.stat(p) for p in full_paths]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+        digests = list(pool.map(hash_file, full_paths))
+    return {
+        rel_path: [st.st_size, st.st_mtime_ns, digest]
+        for rel_path, st, digest in zip(rel_paths, stats, digests)
+    }
+
+
+class ManifestVerification:
+    """Result of verifying a template tree against its manifest."""
+
+    def __init__(self, missing, corrupted, unexpected, touched):
+        self.missing = missing          # in the manifest but not on disk
+        self.corrupted = corrupted      # size or hash differs from the manifest
+        self.unexpected = unexpected    # on disk but not in the manifest
+        self.touched = touched          # mtime changed but content still matches
+
+    @property
+    def ok(self):
+        return not (self.missing or self.corrupted or self.unexpected)
+
+    @property
+    def damaged(self):
+        """Paths that must be restored from a trusted copy."""
+        return sorted(self.missing + self.corrupted)
+
+    def __repr__(self):
+        return (f"ManifestVerification(missing={len(self.missing)}, corrupted={len(self.corrupted)}, "
+                f"unexpected={len(self.unexpected)}, touched={len(self.touched)})")
+
+
+def verify_manifest(root_dir, files, max_workers=None, hash_all=False):
+    """Verify a template tree against manifest file entries.
+
+    Every file is stat()ed first. A size mismatch is corruption outright;
+    files whose size matches but whose mtime differs are "suspicious" and are
+    the only ones that get hashed, across a thread pool. On the happy path no
+    file content is read at all.
+
+    With hash_all, every file of the right size is hashed. This is for
+    copies made with copy2(), whose mtimes match the manifest whatever the
+    content.
+    """
+    missing, corrupted, suspicious = [], [], []
+    for rel_path, (size, mtime_ns, _digest) in files.items():
+        try:
+            st = os.stat(os.path.join(root_dir, *rel_path.split('/')))
+        except FileNotFoundError:
+            missing.append(rel_path)
+            continue
+        if st.st_size != size:
+            corrupted.append(rel_path)
+        elif st.st_mtime_ns != mtime_ns or hash_all:
+            suspicious.append((rel_path, st.st_mtime_ns != mtime_ns))
     
-    try:
-        # Clone with verbose output
-        result = subprocess.run(['git', 'clone', '--verbose', repo_url, target_dir], 
-                              check=True, capture_output=True, text=True)
-        print(f"Repository cloned successfully to {target_dir}")
-        
-        # Verify the clone actually worked
-        if os.path.exists(target_dir) and os.listdir(target_dir):
-            items = os.listdir(target_dir)
-            print(f"Cloned {len(items)} items: {', '.join(items[:5])}{'...' if len(items) > 5 else ''}")
-            
-            # Remove existing Git repository and initialize new one
-            print("Removing existing Git repository...")
-            git_dir = os.path.join(target_dir, '.git')
-            if os.path.exists(git_dir):
-                try:
-                    # Use OS-specific commands to remove Git repository
-                    if platform.system().lower() == "windows":
-                        # Windows: Use rmdir with /s /q for recursive deletion
-                        subprocess.run(['rmdir', '/s', '/q', git_dir], shell=True, check=True, capture_output=True)
-                        print("Existing Git repository removed successfully (Windows)")
-                    else:
-                        # Linux/Mac: Use rm -rf
-                        subprocess.run(['rm', '-rf', git_dir], check=True, capture_output=True)
-                        print("Existing Git repository removed successfully (Unix)")
-                except subprocess.CalledProcessError as e:
-                    print(f"Warning: Could not remove existing Git repository: {e}")
-                    # Try alternative method
+    touched = []
+    if suspicious:
+        full_paths = [os.path.join(root_dir, *p.split('/')) for p, _ in suspicious]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+            digests = list(pool.map(hash_file, full_paths))
+        for (rel_path, mtime_changed), digest in zip(suspicious, digests):
+            if digest != files[rel_path][2]:
+                corrupted.append(rel_path)
+            elif mtime_changed:
+                touched.append(rel_path)
+    
+    unexpected = [p for p in iter_template_files(root_dir) if p not in files]
+    return ManifestVerification(sorted(missing), sorted(corrupted), sorted(unexpected), touched)
+
+
+class FileLock:
+    """Lock on a lock file, shared between processes and threads.
+
+    Blocks until the lock is acquired. Uses flock() on POSIX and
+    msvcrt.locking() on Windows; either way the lock is released by the OS
+    if the holder dies. A shared lock admits other shared holders but no
+    exclusive one. Windows has no shared locks, so there every lock is
+    exclusive.
+    """
+
+    def __init__(self, path, shared=False):
+        self.path = path
+        self.shared = shared
+        self._file = None
+
+    def __enter__(self):
+        self._file = open(self.path, 'a+b')
+        try:
+            if platform.system().lower() == "windows":
+                import msvcrt
+                while True:
                     try:
-                        if platform.system().lower() == "windows":
-                            # Windows: Force delete using PowerShell
-                            ps_command = f'Remove-Item -Path "{git_dir}" -Recurse -Force'
-                            subprocess.run(['powershell', '-Command', ps_command], check=True, capture_output=True)
-                            print("Existing Git repository removed successfully (PowerShell)")
-                        else:
-                            # Linux/Mac: Use find and rm
-                            subprocess.run(['find', git_dir, '-type', 'f', '-exec', 'rm', '-f', '{}', '+'], check=True, capture_output=True)
-                            subprocess.run(['find', git_dir, '-type', 'd', '-exec', 'rmdir', '{}', '+'], check=True, capture_output=True)
-                            print("Existing Git repository removed successfully (find/rm)")
-                    except Exception as e2:
-                        print(f"Warning: Alternative removal method also failed: {e2}")
-                        print("Continuing with existing Git repository...")
+                        self._file.seek(0)
+                        msvcrt.locking(self._file.fileno(), msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        continue  # LK_LOCK gives up after about 10 seconds; keep waiting
+            else:
+                import fcntl
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX)
+        except BaseException:
+            self._file.close()
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if platform.system().lower() == "windows":
+                import msvcrt
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        finally:
+            self._file.close()
+
+
+class TemplateCache:
+    """On-disk cache of cloned templates, each protected by an integrity manifest.
+
+    Layout of one entry (keyed by a hash of the repository URL):
+        <cache_dir>/<key>/template/       git clone of the template
+        <cache_dir>/<key>/manifest.json   commit SHA plus per-file size, mtime and hash
+        <cache_dir>/<key>.lock            held while the entry is checked, written or copied
+
+    Several processes (or threads) may share one cache directory. Each entry
+    is only touched under its lock, and a new entry is built in a temporary
+    directory and renamed into place. Copies from an intact entry take a
+    shared lock, so parallel initializations copy at the same time; only
+    writers (populate, repair) take it exclusively.
+    """
+
+    MANIFEST_VERSION = 1
+
+    def __init__(self, cache_dir, git_backend=None, max_workers=None, log=print):
+        self.cache_dir = os.path.abspath(os.path.expanduser(cache_dir))
+        self.git_backend = git_backend or SubprocessGitBackend()
+        self.max_workers = max_workers
+        self.log = log
+
+    def entry_dir(self, repo_url):
+        key = hashlib.sha1(repo_url.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.cache_dir, key)
+
+    def _load_manifest(self, entry_dir):
+        try:
+            with open(os.path.join(entry_dir, 'manifest.json')) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if manifest.get('version') != self.MANIFEST_VERSION:
+            return None
+        return manifest
+
+    def _lock(self, entry_dir, shared=False):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        return FileLock(entry_dir + '.lock', shared)
+
+    def _save_manifest(self, entry_dir, manifest):
+        manifest_path = os.path.join(entry_dir, 'manifest.json')
+        fd, tmp_path = tempfile.mkstemp(prefix='manifest.', suffix='.tmp', dir=entry_dir)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(manifest, f)
+            os.replace(tmp_path, manifest_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _populate(self, repo_url, entry_dir, source_url=None):
+        """Clone the template (from source_url, a mirror of repo_url, if given) and write its manifest.
+
+        The entry is built in a temporary directory and swapped in, so a
+        failed clone leaves the old entry (if any) untouched. Call with the
+        entry's lock held.
+        """
+        source_url = source_url or repo_url
+        build_dir = tempfile.mkdtemp(prefix=os.path.basename(entry_dir) + '.build-', dir=self.cache_dir)
+        try:
+            self.log(f"Caching template from {source_url}...")
+            self.git_backend.clone(source_url, os.path.join(build_dir, 'template'))
+            manifest = {
+                'version': self.MANIFEST_VERSION,
+                'repo_url': repo_url,
+                'source_url': source_url,
+                'commit': self.git_backend.head_commit(os.path.join(build_dir, 'template')),
+                'files': build_manifest(os.path.join(build_dir, 'template'), self.max_workers),
+            }
+            self._save_manifest(build_dir, manifest)
             
-            # Initialize new Git repository
-            print("Initializing new Git repository...")
+            # A directory cannot be replaced while non-empty, so move the old entry aside first
+            old_dir = None
+            if os.path.exists(entry_dir):
+                old_dir = tempfile.mkdtemp(prefix=os.path.basename(entry_dir) + '.old-', dir=self.cache_dir)
+                os.replace(entry_dir, os.path.join(old_dir, 'entry'))
+            os.replace(build_dir, entry_dir)
+        finally:
+            shutil.rmtree(build_dir, ignore_errors=True)
+        if old_dir:
+            shutil.rmtree(old_dir, ignore_errors=True)
+        self.log(f"Template cached at {os.path.join(entry_dir, 'template')} ({len(manifest['files'])} files)")
+        return manifest
+
+    def _repair_cache(self, entry_dir, manifest, result):
+        """Restore damaged cache files from the cache's own git objects."""
+        checkout_dir = os.path.join(entry_dir, 'template')
+        for rel_path in result.unexpected:
+            os.remove(os.path.join(checkout_dir, *rel_path.split('/')))
+        if result.damaged:
+            self.git_backend.restore_files(checkout_dir, result.damaged)
+            # Restored files have new mtimes; re-check them by content and
+            # record the new stat metadata so the next run takes the fast path.
+            files = manifest['files']
+            for rel_path in result.damaged:
+                full_path = os.path.join(checkout_dir, *rel_path.split('/'))
+                st = os.stat(full_path)
+                if hash_file(full_path) != files[rel_path][2]:
+                    raise TemplateIntegrityError(f"Cached file could not be restored: {rel_path}")
+                files[rel_path] = [st.st_size, st.st_mtime_ns, files[rel_path][2]]
+            self._save_manifest(entry_dir, manifest)
+
+    def ensure(self, repo_url, refresh=False, source_url=None, expected_commit=None):
+        """Return (checkout_dir, manifest) for a verified cached copy of repo_url.
+
+        The cache is keyed by repo_url; a missing or outdated entry is cloned
+        from source_url (e.g. the fastest mirror) when given. If
+        expected_commit is given, an entry at any other commit is refreshed.
+        """
+        with self._lock(self.entry_dir(repo_url)):
+            return self._ensure(repo_url, refresh, source_url, expected_commit)
+
+    def _ensure(self, repo_url, refresh, source_url, expected_commit):
+        entry_dir = self.entry_dir(repo_url)
+        checkout_dir = os.path.join(entry_dir, 'template')
+        manifest = None if refresh else self._load_manifest(entry_dir)
+        if manifest is not None and expected_commit and not commit_matches(manifest['commit'], expected_commit):
+            self.log(f"Cached template is at {manifest['commit'][:12]}, "
+                     f"latest is {expected_commit[:12]}. Refreshing cache...")
+            manifest = None
+        if manifest is None or not os.path.isdir(checkout_dir):
+            return checkout_dir, self._populate(repo_url, entry_dir, source_url)
+        
+        result = verify_manifest(checkout_dir, manifest['files'], self.max_workers)
+        if result.touched:
+            # Content is intact; record the new mtimes so they are not re-hashed next time
+            for rel_path in result.touched:
+                st = os.stat(os.path.join(checkout_dir, *rel_path.split('/')))
+                manifest['files'][rel_path][1] = st.st_mtime_ns
+            self._save_manifest(entry_dir, manifest)
+        if not result.ok:
+            self.log(f"Template cache is damaged ({len(result.damaged)} damaged, "
+                     f"{len(result.unexpected)} unexpected files). Repairing...")
             try:
-                subprocess.run(['git', 'init'], cwd=target_dir, check=True, capture_output=True, text=True)
-                print("New Git repository initialized successfully")
-                
-                # Add all files to the new repository
-                subprocess.run(['git', 'add', '.'], cwd=target_dir, check=True, capture_output=True, text=True)
-                print("All files added to new Git repository")
-                
-                # Make initial commit
-                subprocess.run(['git', 'commit', '-m', 'Initial commit from Fullstack-boilerplate'], 
-                             cwd=target_dir, check=True, capture_output=True, text=True)
-                print("Initial commit created successfully")
-                
-            except subprocess.CalledProcessError as e:
-                print(f"Warning: Could not initialize new Git repository: {e}")
-                if e.stderr:
-                    print(f"Git error: {e.stderr}")
-            
-            return True
-        else:
-            print("Error: Clone appeared successful but directory is empty")
-            return False
+                self._repair_cache(entry_dir, manifest, result)
+            except (GitBackendError, TemplateIntegrityError, OSError) as e:
+                self.log(f"Repair failed ({e}). Re-cloning template...")
+                return checkout_dir, self._populate(repo_url, entry_dir, source_url)
+            self.log("Template cache repaired")
+        return checkout_dir, manifest
+
+    def cached_commit(self, repo_url):
+        """Return the commit of the cached template, or None if it is not cached."""
+        manifest = self._load_manifest(self.entry_dir(repo_url))
+        return manifest['commit'] if manifest else None
+
+    def template_size(self, repo_url):
+        """Return the total size of the cached template in bytes, or None if it is not cached."""
+        manifest = self._load_manifest(self.entry_dir(repo_url))
+        if manifest is None:
+            return None
+        return sum(entry[0] for entry in manifest['files'].values())
+
+    def _intact_entry(self, repo_url, expected_commit):
+        """Return (checkout_dir, manifest) if the entry can be used without writing to it, else None."""
+        entry_dir = self.entry_dir(repo_url)
+        checkout_dir = os.path.join(entry_dir, 'template')
+        manifest = self._load_manifest(entry_dir)
+        if manifest is None or not os.path.isdir(checkout_dir):
+            return None
+        if expected_commit and not commit_matches(manifest['commit'], expected_commit):
+            return None
+        result = verify_manifest(checkout_dir, manifest['files'], self.max_workers)
+        if not result.ok or result.touched:
+            return None
+        return checkout_dir, manifest
+
+    def materialize(self, repo_url, target_dir, refresh=False, source_url=None, expected_commit=None):
+        """Copy a verified cached template (without .git) into target_dir and hash-check the copy.
+
+        Returns the manifest of the template that was materialized. An intact
+        entry is copied under a shared lock; one that must be refreshed or
+        repaired first is handled under the exclusive lock.
+        """
+        entry_dir = self.entry_dir(repo_url)
+        entry = None
+        if not refresh:
+            with self._lock(entry_dir, shared=True):
+                entry = self._intact_entry(repo_url, expected_commit)
+                if entry:
+                    try:
+                        self._copy(entry[0], target_dir, entry[1])
+                    except TemplateIntegrityError as e:
+                        # The cache's content changed without its size or mtime changing
+                        self.log(f"Cached template does not match its manifest ({e}). Re-cloning template...")
+                        shutil.rmtree(target_dir, ignore_errors=True)
+                        entry, refresh = None, True
+        if entry is None:
+            with self._lock(entry_dir):
+                entry = self._ensure(repo_url, refresh, source_url, expected_commit)
+                self._copy(entry[0], target_dir, entry[1])
+        manifest = entry[1]
+        self.log(f"Template {manifest['commit'][:12]} materialized and verified "
+                 f"({len(manifest['files'])} files hashed)")
+        return manifest
+
+    def _copy(self, checkout_dir, target_dir, manifest):
+        """Copy the cached template and check every copied file's hash, re-copying damaged ones.
+
+        copy2() preserves mtimes, so the copy cannot be verified by stat alone.
+        """
+        shutil.copytree(checkout_dir, target_dir, ignore=shutil.ignore_patterns('.git'))
+        files = manifest['files']
+        result = verify_manifest(target_dir, files, self.max_workers, hash_all=True)
+        if not result.ok:
+            for rel_path in result.unexpected:
+                os.remove(os.path.join(target_dir, *rel_path.split('/')))
+            for rel_path in result.damaged:
+                dest = os.path.join(target_dir, *rel_path.split('/'))
+                os.makedirs(os.path.dirname(dest), exist_ok=True)
+                shutil.copy2(os.path.join(checkout_dir, *rel_path.split('/')), dest)
+            result = verify_manifest(target_dir, files, self.max_workers, hash_all=True)
+            if not result.ok:
+                raise TemplateIntegrityError(f"Materialized template failed verification: {result}")
+
+
+DEFAULT_REPO_URL = "https://github.com/Kicchu02/Fullstack-boilerplate.git"
+
+# Written into every initialized project (and committed) so drift scans can find its template commit
+ORIGIN_FILE = '.project-initializer.json'
+
+# Happy-eyeballs stagger: start the next mirror probe if no answer arrives within this time
+MIRROR_STAGGER_SECONDS = 0.25
+# Latency recorded for a failed probe, so failing mirrors sink to the back of the order
+MIRROR_FAILURE_LATENCY = 10.0
+MIRROR_LATENCY_SMOOTHING = 0.3
+
+
+class MirrorLatencyStore:
+    """Remembers how quickly each mirror answered, to order future probes.
+
+    Latencies are smoothed with an exponentially weighted moving average and
+    stored as JSON. Failures count as MIRROR_FAILURE_LATENCY seconds.
+    """
+
+    def __init__(self, path=None, log=print):
+        self.path = path or os.path.join(get_cache_home(), 'mirrors.json')
+        self.log = log
+        self._lock = threading.Lock()
+        try:
+            with open(self.path) as f:
+                self.latencies = json.load(f)
+        except (OSError, ValueError):
+            self.latencies = {}
+
+    def order(self, mirror_urls):
+        """Return mirror_urls sorted fastest first; unknown mirrors keep their order at the end."""
+        return sorted(mirror_urls, key=lambda url: self.latencies.get(url, float('inf')))
+
+    def record(self, url, latency):
+        """Record one observed latency in seconds (None for a failure)."""
+        sample = MIRROR_FAILURE_LATENCY if latency is None else latency
+        with self._lock:
+            previous = self.latencies.get(url)
+            if previous is None:
+                self.latencies[url] = sample
+            else:
+                self.latencies[url] = previous + MIRROR_LATENCY_SMOOTHING * (sample - previous)
+
+    def save(self):
+        """Write the latencies to disk (best effort)."""
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            # A unique temporary file, as other processes may be saving at the same time
+            fd, tmp_path = tempfile.mkstemp(prefix='mirrors.', suffix='.tmp', dir=os.path.dirname(self.path))
+            with self._lock:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(self.latencies, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            self.log(f"Warning: Could not save mirror latencies: {e}")
+
+
+class MirrorRaceResult:
+    """The mirror that won a race, and why the others did not."""
+
+    def __init__(self, url, commit, latency, failures):
+        self.url = url
+        self.commit = commit
+        self.latency = latency
+        self.failures = failures  # list of (url, reason)
+
+
+def race_mirrors(mirror_urls, git_backend, expected_commit=None, ref='HEAD',
+                 latency_store=None, stagger=MIRROR_STAGGER_SECONDS,
+                 deadline=DEFAULT_PHASE_LIMITS['fetch'].deadline):
+    """Probe template mirrors with ls-remote, happy-eyeballs style, and return the winner.
+
+    Mirrors are tried in order of remembered latency. The first probe starts
+    at once; each further probe starts when the previous ones have been
+    silent for `stagger` seconds or have all failed. The first mirror whose
+    `ref` points at expected_commit (or at any commit, if none is expected)
+    wins and the remaining probes are cancelled.
+
+    The race gives up after `deadline` seconds (None or 0 for no limit), even
+    if a backend cannot interrupt its own probes (dulwich cannot).
+
+    Raises GitBackendError if no mirror qualifies in time.
+    """
+    ordered = latency_store.order(mirror_urls) if latency_store else list(mirror_urls)
+    results = queue.Queue()
+    cancel = threading.Event()
+    
+    def probe(url):
+        start = time.monotonic()
+        try:
+            commit = git_backend.ls_remote(url, cancel_event=cancel).get(ref)
+            results.put((url, commit, time.monotonic() - start, None))
+        except Exception as e:
+            results.put((url, None, time.monotonic() - start, e))
+    
+    failures = []
+    started = 0
+    pending = 0
+    race_start = time.monotonic()
+    try:
+        while True:
+            if pending == 0:
+                if started == len(ordered):
+                    reasons = "; ".join(f"{url}: {reason}" for url, reason in failures)
+                    raise GitBackendError(f"No template mirror is usable ({reasons})")
+                threading.Thread(target=probe, args=(ordered[started],), daemon=True).start()
+                started += 1
+                pending += 1
+            timeout = stagger if started < len(ordered) else None
+            if deadline:
+                remaining = deadline - (time.monotonic() - race_start)
+                if remaining <= 0:
+                    reasons = "".join(f"; {url}: {reason}" for url, reason in failures)
+                    raise GitBackendError(f"No template mirror answered within {deadline}s{reasons}")
+                timeout = remaining if timeout is None else min(timeout, remaining)
+            try:
+                url, commit, latency, error = results.get(timeout=timeout)
+            except queue.Empty:
+                if started == len(ordered) or (deadline and time.monotonic() - race_start >= deadline):
+                    continue  # the deadline check above reports it
+                # Nobody answered in time: start the next mirror alongside the others
+                threading.Thread(target=probe, args=(ordered[started],), daemon=True).start()
+                started += 1
+                pending += 1
+                continue
+            pending -= 1
             
-    except subprocess.CalledProcessError as e:
-        print(f"Error cloning repository: {e}")
-        if e.stderr:
-            print(f"Git error: {e.stderr}")
-        return False
-    except Exception as e:
-        print(f"Unexpected error during clone: {e}")
-        return False
+            if error is not None:
+                failures.append((url, error))
+            elif commit is None:
+                failures.append((url, f"{ref} not found"))
+            elif expected_commit and not commit_matches(commit, expected_commit):
+                failures.append((url, f"{ref} is at {commit[:12]}, expected {expected_commit[:12]}"))
+            else:
+                if latency_store:
+                    latency_store.record(url, latency)
+                return MirrorRaceResult(url, commit, latency, failures)
+            if latency_store:
+                latency_store.record(url, None)
+    finally:
+        cancel.set()
+        if latency_store:
+            latency_store.save()
+
+
+# Rough disk footprint of a freshly bootstrapped project: the template itself
+# (used when no cached manifest is available) plus installed npm and Gradle
+# dependencies.
+ESTIMATED_TEMPLATE_BYTES = 5 * 1024 * 1024
+ESTIMATED_DEPENDENCY_BYTES = 1024 * 1024 * 1024
+
+# Existing targets with more files than this get a "removal may take a while" warning
+LARGE_TARGET_FILE_COUNT = 10000
+
+
+def format_size(num_bytes):
+    """Format a byte count for display, e.g. 1.5 GB."""
+    size = float(num_bytes)
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if size < 1024 or unit == 'GB':
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+def measure_tree(path):
+    """Return (file_count, total_bytes) for a directory tree, without following symlinks."""
+    file_count = 0
+    total_bytes = 0
+    stack = [path]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        file_count += 1
+                        total_bytes += entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    continue
+    return file_count, total_bytes
+
+
+class PreflightResult:
+    """Outcome of checking a target directory before any work starts."""
+
+    def __init__(self, target_dir):
+        self.target_dir = target_dir
+        self.exists = False
+        self.existing_files = 0
+        self.existing_bytes = 0
+        self.writable = False
+        self.free_bytes = None
+        self.required_bytes = 0
+        self.errors = []
+        self.warnings = []
+
+    @property
+    def ok(self):
+        return not self.errors and not self.warnings
+
+    def summary(self):
+        """Return a one-line description of the most important finding."""
+        if self.errors:
+            return self.errors[0]
+        if self.warnings:
+            return self.warnings[0]
+        free = f", {format_size(self.free_bytes)} free" if self.free_bytes is not None else ""
+        return f"OK (needs ~{format_size(self.required_bytes)}{free})"
+
+
+def preflight_target(target_dir, template_bytes=None):
+    """Check a project directory before initialization.
+
+    Reports whether the target already exists and how large it is (it is
+    removed with rmtree before cloning, which takes time proportional to its
+    file count), whether the nearest existing ancestor is writable, and
+    whether there is enough free disk space for the template plus its
+    dependencies.
+    """
+    target_dir = os.path.abspath(target_dir)
+    result = PreflightResult(target_dir)
+    
+    existing_dir = target_dir
+    while not os.path.exists(existing_dir):
+        parent = os.path.dirname(existing_dir)
+        if parent == existing_dir:
+            break
+        existing_dir = parent
+    
+    if os.path.isdir(target_dir):
+        result.exists = True
+        result.existing_files, result.existing_bytes = measure_tree(target_dir)
+        if result.existing_files:
+            message = (f"Target exists ({result.existing_files} files, {format_size(result.existing_bytes)}) "
+                       f"and will be removed")
+            if result.existing_files > LARGE_TARGET_FILE_COUNT:
+                message += "; removal may take a while"
+            result.warnings.append(message)
+    elif os.path.exists(target_dir):
+        result.errors.append(f"Target exists and is not a directory: {target_dir}")
+    
+    result.writable = os.access(existing_dir, os.W_OK)
+    if not result.writable:
+        result.errors.append(f"Cannot write to directory: {existing_dir}")
+    
+    result.required_bytes = (template_bytes or ESTIMATED_TEMPLATE_BYTES) + ESTIMATED_DEPENDENCY_BYTES
+    try:
+        result.free_bytes = shutil.disk_usage(existing_dir).free
+    except OSError:
+        pass
+    else:
+        # The existing target is removed first, so its space becomes available
+        available = result.free_bytes + result.existing_bytes
+        if available < result.required_bytes:
+            result.warnings.insert(0, f"Low disk space: {format_size(available)} available, "
+                                      f"~{format_size(result.required_bytes)} needed")
+    return result
+
+
+def write_origin_record(project_dir, repo_url, source_url, commit):
+    """Write the template origin record into a newly created project."""
+    record = {
+        'template_url': repo_url,
+        'source_url': source_url,
+        'commit': commit,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+    }
+    with open(os.path.join(project_dir, ORIGIN_FILE), 'w') as f:
+        json.dump(record, f, indent=2)
+        f.write('\n')
+
+
+def read_origin_record(project_dir):
+    """Return the template origin record of a project, or None if it has none."""
+    try:
+        with open(os.path.join(project_dir, ORIGIN_FILE)) as f:
+            record = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(record, dict):
+        return None
+    # Both values end up on git command lines, so nothing that git could read as an option
+    template_url, commit = record.get('template_url'), record.get('commit')
+    if not isinstance(template_url, str) or not template_url or template_url.startswith('-'):
+        return None
+    if not isinstance(commit, str) or len(commit) != 40 or not all(c in '0123456789abcdef' for c in commit.lower()):
+        return None
+    record['commit'] = commit.lower()
+    return record
 
 
 def get_os_type():
@@ -135,91 +1271,61 @@ def get_os_type():
         return "unknown"
 
 
-def execute_bootstrap(target_dir, os_type):
-    """Execute the appropriate bootstrap file based on OS."""
-    # Ensure target_dir is a proper path
-    if not os.path.isabs(target_dir):
-        target_dir = os.path.abspath(target_dir)
-    
-    print(f"Executing bootstrap from directory: {target_dir}")
-    
-    if os_type == "windows":
-        bootstrap_file = os.path.join(target_dir, "bootstrap.bat")
-        if os.path.exists(bootstrap_file):
-            print("Executing Windows bootstrap script...")
-            try:
-                # Use shell=True for Windows batch files
-                subprocess.run(bootstrap_file, shell=True, check=True, cwd=target_dir)
-                print("Windows bootstrap completed successfully!")
-                return True
-            except subprocess.CalledProcessError as e:
-                print(f"Error executing Windows bootstrap: {e}")
-                return False
-        else:
-            print(f"Windows bootstrap file not found: {bootstrap_file}")
-            print(f"Available files in {target_dir}: {os.listdir(target_dir) if os.path.exists(target_dir) else 'Directory does not exist'}")
-            return False
+def print_output(text):
+    """Forward child process output to the console as it arrives."""
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
+def remove_tree(path):
+    """Remove a directory tree in-process. Returns the error, or None on success.
+
+    Git marks its object files read-only, which makes os.remove() fail on
+    Windows; such files are made writable and removed again.
+    """
+    def clear_readonly(func, failed_path, _exc):
+        os.chmod(failed_path, stat.S_IWRITE)
+        func(failed_path)
     
-    elif os_type == "unix":
-        bootstrap_file = os.path.join(target_dir, "bootstrap.sh")
-        if os.path.exists(bootstrap_file):
-            print("Executing Unix bootstrap script...")
-            try:
-                # Make the script executable
-                os.chmod(bootstrap_file, 0o755)
-                # Execute the shell script
-                subprocess.run([bootstrap_file], check=True, cwd=target_dir)
-                print("Unix bootstrap completed successfully!")
-                return True
-            except subprocess.CalledProcessError as e:
-                print(f"Error executing Unix bootstrap: {e}")
-                return False
+    try:
+        if sys.version_info >= (3, 12):
+            shutil.rmtree(path, onexc=clear_readonly)
         else:
-            print(f"Unix bootstrap file not found: {bootstrap_file}")
-            print(f"Available files in {target_dir}: {os.listdir(target_dir) if os.path.exists(target_dir) else 'Directory does not exist'}")
-            return False
-    
-    else:
-        print(f"Unsupported operating system: {platform.system()}")
-        return False
-    
-    return True
+            shutil.rmtree(path, onerror=clear_readonly)
+    except OSError as e:
+        return e
+    return None
 
 
-def validate_project_name(project_name):
-    """Validate the project name."""
+def project_name_error(project_name):
+    """Return why the project name is invalid, or None if it is valid."""
     # Check if project name is provided
     if not project_name or not project_name.strip():
-        print("Error: Please enter a valid project name.")
-        return False
+        return "Please enter a valid project name."
     
     # Check for invalid characters in project name
     invalid_chars = '<>:"|?*\\/'
     if any(char in project_name for char in invalid_chars):
-        print(f"Error: Project name contains invalid characters: {invalid_chars}")
-        return False
+        return f"Project name contains invalid characters: {invalid_chars}"
     
     # Check for reserved names
     reserved_names = ['.', '..', 'CON', 'PRN', 'AUX', 'NUL', 'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9', 'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9']
     if project_name.upper() in [name.upper() for name in reserved_names]:
-        print(f"Error: Cannot use reserved name: {project_name}")
-        return False
+        return f"Cannot use reserved name: {project_name}"
     
-    return True
+    return None
 
 
-def validate_project_path(project_path):
-    """Validate the project path (can be relative or absolute)."""
+def project_path_error(project_path):
+    """Return why the project path (relative or absolute) is invalid, or None if it is valid."""
     # Check if path is provided
     if not project_path or not project_path.strip():
-        print("Error: Please enter a valid project path.")
-        return False
+        return "Please enter a valid project path."
     
     # Check for invalid characters in the path
     invalid_chars = '<>|?*'
     if any(char in project_path for char in invalid_chars):
-        print(f"Error: Project path contains invalid characters: {invalid_chars}")
-        return False
+        return f"Project path contains invalid characters: {invalid_chars}"
     
     # Check if the path is accessible for creation
     try:
@@ -231,13 +1337,685 @@ def validate_project_path(project_path):
             parent_dir = os.getcwd()
         
         if not os.access(parent_dir, os.W_OK):
-            print(f"Error: Cannot write to directory: {parent_dir}")
-            return False
+            return f"Cannot write to directory: {parent_dir}"
     except Exception as e:
-        print(f"Error validating project path: {e}")
-        return False
+        return f"Error validating project path: {e}"
+    
+    return None
+
+
+def get_full_project_dir(project_name, project_path):
+    """Return the absolute directory a project will be created in."""
+    if os.path.isabs(project_path):
+        return os.path.join(project_path, project_name)
+    # Relative path - convert to absolute
+    return os.path.abspath(os.path.join(project_path, project_name))
+
+
+class InitializationError(Exception):
+    """Raised inside an Initializer when a phase cannot continue."""
+
+
+class SystemCheck:
+    """Result of the one-off system checks of an Initializer session."""
+
+    def __init__(self, os_name, os_type, git_available):
+        self.os_name = os_name
+        self.os_type = os_type
+        self.git_available = git_available
+
+
+class InitializationResult:
+    """Outcome of Initializer.initialize()."""
+
+    def __init__(self, project_dir=None):
+        self.project_dir = project_dir
+        self.success = False
+        self.failed_phase = None   # 'validate', 'preflight', 'system', 'clone', 'git' or 'bootstrap'
+        self.error = None
+        self.error_details = None  # e.g. git's stderr
+        self.warnings = []
+        self.preflight = None      # PreflightResult
+        self.template_url = None
+        self.source_url = None     # mirror the template was cloned from
+        self.commit = None         # template commit the project was created from
+        self.retries = []          # RetryEvent for each retried clone attempt
+        self.timings = {}          # phase -> seconds
+
+    def __repr__(self):
+        status = "success" if self.success else f"failed in {self.failed_phase}: {self.error}"
+        return f"InitializationResult({self.project_dir!r}, {status})"
+
+
+class Initializer:
+    """Reusable session for creating projects from the template.
+
+    A session keeps warm state between projects: the git backend and the
+    result of the system checks, the template cache, mirror latencies and
+    the environment for child processes. Embedders can provision many
+    projects from one process without re-running checks:
+
+        session = Initializer(cache_dir="~/.cache/project-templates")
+        for name in ["billing", "search"]:
+            result = session.initialize(name, "/srv/projects")
+            if not result.success:
+                print(result.failed_phase, result.error)
+
+    Nothing is printed. Progress messages go to log (silent by default)
+    and bootstrap output goes to on_output. initialize() returns an
+    InitializationResult.
+
+    git_backend is a backend name or a GitBackend instance. A
+    SubprocessGitBackend created without an env is given the session's
+    environment; one created with an explicit env keeps it.
+    """
+
+    def __init__(self, repo_url=DEFAULT_REPO_URL, mirror_urls=None, git_backend="subprocess", cache_dir=None,
+                 phase_limits=None, retries=DEFAULT_RETRY_ATTEMPTS - 1, expected_commit=None, env=None,
+                 log=None, on_output=None):
+        self.repo_url = repo_url
+        self.mirror_urls = [repo_url] + [url for url in mirror_urls or [] if url != repo_url]
+        self.phase_limits = phase_limits or DEFAULT_PHASE_LIMITS
+        self.retries = retries
+        self.expected_commit = expected_commit.lower() if expected_commit else None
+        # Nobody may be watching the terminal, so git must fail instead of prompting for credentials
+        self.env = dict(os.environ if env is None else env)
+        self.env.setdefault('GIT_TERMINAL_PROMPT', '0')
+        self.log = log or (lambda message: None)
+        self.on_output = on_output
+        if isinstance(git_backend, GitBackend):
+            self.git_backend = git_backend
+            if isinstance(git_backend, SubprocessGitBackend) and git_backend.env is None:
+                git_backend.env = self.env
+        else:
+            self.git_backend = get_git_backend(git_backend, self.phase_limits, self.env)
+        self.template_cache = TemplateCache(cache_dir, self.git_backend,
+                                            log=lambda message: self.log(message)) if cache_dir else None
+        self.latency_store = MirrorLatencyStore(log=lambda message: self.log(message))
+        self._system_check = None
+
+    def check_system(self, refresh=False):
+        """Return the OS and git checks, running them only once per session unless refresh is set."""
+        if self._system_check is None or refresh:
+            self._system_check = SystemCheck(platform.system(), get_os_type(), self.git_backend.is_available())
+        return self._system_check
+
+    def validate(self, project_name, project_path):
+        """Return a list of problems with the project name and path (empty if both are valid)."""
+        errors = [project_name_error(project_name), project_path_error(project_path)]
+        return [error for error in errors if error]
+
+    def preflight(self, project_dir):
+        """Check the target directory before any work starts."""
+        template_bytes = self.template_cache.template_size(self.repo_url) if self.template_cache else None
+        return preflight_target(project_dir, template_bytes)
+
+    def initialize(self, project_name, project_path, bootstrap=True, preflight=None):
+        """Create one project and return an InitializationResult.
+
+        A PreflightResult computed earlier for the same directory can be
+        passed in to avoid measuring the target again.
+        """
+        result = InitializationResult()
+        result.template_url = self.repo_url
+        errors = self.validate(project_name, project_path)
+        if errors:
+            result.failed_phase, result.error = 'validate', errors[0]
+            return result
+        project_dir = result.project_dir = get_full_project_dir(project_name, project_path)
+        
+        phase = 'preflight'
+        phase_start = time.perf_counter()
+        try:
+            result.preflight = preflight or self.preflight(project_dir)
+            for warning in result.preflight.warnings:
+                self.log(f"Warning: {warning}")
+            result.warnings.extend(result.preflight.warnings)
+            if result.preflight.errors:
+                raise InitializationError(result.preflight.errors[0])
+            
+            phase = 'system'
+            if not self.check_system().git_available:
+                raise InitializationError(f"Git backend '{self.git_backend.name}' is not available")
+            
+            for phase, step in [('clone', self.clone_template), ('git', self.reset_git_history)]:
+                result.timings[phase] = time.perf_counter()
+                step(project_dir, result)
+                result.timings[phase] = time.perf_counter() - result.timings[phase]
+            
+            if bootstrap:
+                phase = 'bootstrap'
+                result.timings[phase] = time.perf_counter()
+                self.run_bootstrap(project_dir)
+                result.timings[phase] = time.perf_counter() - result.timings[phase]
+        except (InitializationError, GitBackendError, TemplateIntegrityError, WatchdogTimeout,
+                subprocess.CalledProcessError, OSError) as e:
+            result.failed_phase = phase
+            result.error = str(e)
+            result.error_details = getattr(e, 'stderr', None)
+            if phase in result.timings:
+                result.timings[phase] = time.perf_counter() - result.timings[phase]
+            return result
+        finally:
+            result.timings['total'] = time.perf_counter() - phase_start
+        
+        result.success = True
+        return result
+
+    def clone_template(self, project_dir, result):
+        """Put a fresh copy of the template into project_dir and record its origin.
+
+        Mirrors are raced when there are several, an expected commit or a
+        cache to keep fresh. Failed or stalled clones are retried with
+        jittered exponential backoff and recorded in result.retries.
+        """
+        self.log(f"Cloning repository from {self.repo_url}...")
+        self.log(f"Target directory: {project_dir}")
+        
+        if os.path.exists(project_dir):
+            self.log(f"Directory {project_dir} already exists. Removing it...")
+            try:
+                shutil.rmtree(project_dir)
+            except PermissionError as e:
+                raise InitializationError(f"Cannot remove existing directory {project_dir}: {e}. "
+                                          "Please close any applications using this directory and try again.")
+        
+        def fetch_template():
+            source_url, commit = self.repo_url, self.expected_commit
+            if len(self.mirror_urls) > 1 or self.expected_commit or self.template_cache:
+                try:
+                    race = race_mirrors(self.mirror_urls, self.git_backend, self.expected_commit,
+                                        latency_store=self.latency_store,
+                                        deadline=self.phase_limits['fetch'].deadline)
+                except GitBackendError as e:
+                    # Offline or during an outage, a cached copy of the right commit is good enough
+                    cached = self.template_cache.cached_commit(self.repo_url) if self.template_cache else None
+                    if cached is None or (self.expected_commit and not commit_matches(cached, self.expected_commit)):
+                        raise
+                    self.log(f"Warning: {e}. Using the cached template (commit {cached[:12]}).")
+                    race = None
+                    commit = cached
+                if race:
+                    for url, reason in race.failures:
+                        self.log(f"Warning: Mirror {url} not used: {reason}")
+                    self.log(f"Using mirror {race.url} (answered in {race.latency * 1000:.0f} ms, "
+                             f"commit {race.commit[:12]})")
+                    source_url, commit = race.url, race.commit
+            if self.template_cache:
+                manifest = self.template_cache.materialize(self.repo_url, project_dir, source_url=source_url,
+                                                           expected_commit=commit)
+                source_url, cloned = manifest.get('source_url', source_url), manifest['commit']
+            else:
+                self.git_backend.clone(source_url, project_dir)
+                cloned = self.git_backend.head_commit(project_dir)
+            # The mirror may have moved between the probe and the clone
+            if commit and not commit_matches(cloned, commit):
+                raise GitBackendError(f"{source_url} gave commit {cloned[:12]}, expected {commit[:12]}")
+            return source_url, cloned
+        
+        def on_retry(event):
+            self.log(f"Warning: {event.phase} attempt {event.attempt} failed: {event.error}")
+            self.log(f"Retrying in {event.delay:.1f} seconds...")
+            result.retries.append(event)
+            shutil.rmtree(project_dir, ignore_errors=True)
+        
+        result.source_url, result.commit = retry_with_backoff(
+            fetch_template, 'clone', self.retries + 1, retry_on=(GitBackendError,), on_retry=on_retry)
+        
+        # Verify the clone actually worked
+        items = os.listdir(project_dir) if os.path.isdir(project_dir) else []
+        if not items:
+            raise InitializationError("Clone appeared successful but directory is empty")
+        self.log(f"Repository cloned successfully to {project_dir}")
+        self.log(f"Cloned {len(items)} items: {', '.join(items[:5])}{'...' if len(items) > 5 else ''}")
+        
+        # Check for key files
+        expected_files = ['README.md', 'bootstrap.bat', 'bootstrap.sh']
+        found_files = [f for f in expected_files if os.path.exists(os.path.join(project_dir, f))]
+        if found_files:
+            self.log(f"Found key files: {', '.join(found_files)}")
+        else:
+            self.log("Warning: No expected key files found")
+            result.warnings.append("No expected key files found")
+        
+        # Record where the template came from, for drift scans
+        write_origin_record(project_dir, self.repo_url, result.source_url, result.commit)
+        self.log(f"Template origin recorded in {ORIGIN_FILE} (commit {result.commit[:12]})")
+
+    def reset_git_history(self, project_dir, result):
+        """Replace the template's git history with a fresh repository and initial commit.
+
+        Failures here are recorded as warnings; the project is still usable.
+        """
+        # Remove existing Git repository and initialize new one
+        self.log("Removing existing Git repository...")
+        git_dir = os.path.join(project_dir, '.git')
+        if os.path.exists(git_dir):
+            error = remove_tree(git_dir)
+            if error is None:
+                self.log("Existing Git repository removed successfully")
+            else:
+                self.log(f"Warning: Could not remove existing Git repository: {error}")
+                error = self._remove_tree_externally(git_dir)
+            if error is not None:
+                self.log(f"Warning: Alternative removal method also failed: {error}")
+                self.log("Continuing with existing Git repository...")
+                result.warnings.append(f"Could not remove the template's Git history: {error}")
+        
+        # Initialize new Git repository
+        self.log("Initializing new Git repository...")
+        try:
+            self.git_backend.init(project_dir)
+            self.log("New Git repository initialized successfully")
+            
+            # Add all files to the new repository
+            self.git_backend.add_all(project_dir)
+            self.log("All files added to new Git repository")
+            
+            # Make initial commit
+            self.git_backend.commit(project_dir, 'Initial commit from Fullstack-boilerplate')
+            self.log("Initial commit created successfully")
+        except GitBackendError as e:
+            self.log(f"Warning: Could not initialize new Git repository: {e}")
+            if e.stderr:
+                self.log(f"Git error: {e.stderr}")
+            result.warnings.append(f"Could not initialize new Git repository: {e}")
+
+    def _remove_tree_externally(self, path):
+        """Fallback for remove_tree(): remove path with the OS's own tools. Returns the error, or None."""
+        try:
+            # Use OS-specific commands to remove Git repository
+            if platform.system().lower() == "windows":
+                # Windows: Use rmdir with /s /q for recursive deletion
+                subprocess.run(['rmdir', '/s', '/q', path], shell=True, check=True, capture_output=True)
+                self.log("Existing Git repository removed successfully (Windows)")
+            else:
+                # Linux/Mac: Use rm -rf
+                subprocess.run(['rm', '-rf', path], check=True, capture_output=True)
+                self.log("Existing Git repository removed successfully (Unix)")
+            return None
+        except subprocess.CalledProcessError as e:
+            self.log(f"Warning: Could not remove existing Git repository: {e}")
+        # Try alternative method
+        try:
+            if platform.system().lower() == "windows":
+                # Windows: Force delete using PowerShell
+                ps_command = f'Remove-Item -Path "{path}" -Recurse -Force'
+                subprocess.run(['powershell', '-Command', ps_command], check=True, capture_output=True)
+                self.log("Existing Git repository removed successfully (PowerShell)")
+            else:
+                # Linux/Mac: Use find and rm
+                subprocess.run(['find', path, '-type', 'f', '-exec', 'rm', '-f', '{}', '+'], check=True, capture_output=True)
+                subprocess.run(['find', path, '-type', 'd', '-exec', 'rmdir', '{}', '+'], check=True, capture_output=True)
+                self.log("Existing Git repository removed successfully (find/rm)")
+            return None
+        except Exception as e:
+            return e
+
+    def run_bootstrap(self, project_dir):
+        """Execute the bootstrap script for this OS under the stall watchdog.
+
+        The script is not retried since it may have partially installed
+        dependencies.
+        """
+        self.log(f"Executing bootstrap from directory: {project_dir}")
+        os_type = self.check_system().os_type
+        if os_type == "windows":
+            label, bootstrap_file = "Windows", os.path.join(project_dir, "bootstrap.bat")
+            # Use shell=True for Windows batch files
+            args, shell = bootstrap_file, True
+        elif os_type == "unix":
+            label, bootstrap_file = "Unix", os.path.join(project_dir, "bootstrap.sh")
+            args, shell = [bootstrap_file], False
+        else:
+            raise InitializationError(f"Unsupported operating system: {platform.system()}")
+        
+        if not os.path.exists(bootstrap_file):
+            self.log(f"Available files in {project_dir}: {os.listdir(project_dir)}")
+            raise InitializationError(f"{label} bootstrap file not found: {bootstrap_file}")
+        
+        self.log(f"Executing {label} bootstrap script...")
+        if os_type == "unix":
+            # Make the script executable
+            os.chmod(bootstrap_file, 0o755)
+        try:
+            run_with_watchdog(args, self.phase_limits['bootstrap'], watch_dir=project_dir,
+                              on_output=self.on_output, description=f"{label} bootstrap",
+                              cwd=project_dir, shell=shell, env=self.env)
+        except subprocess.CalledProcessError as e:
+            raise InitializationError(f"Error executing {label} bootstrap: {e}")
+        except WatchdogTimeout as e:
+            raise InitializationError(f"{e}. The bootstrap process was stopped.")
+        self.log(f"{label} bootstrap completed successfully!")
+
+
+# Directories never searched for projects or hashed during a drift scan
+SCAN_SKIP_DIRS = {'.git', 'node_modules', '.gradle', 'build', 'dist', '__pycache__', '.venv', 'venv'}
+DEFAULT_SCAN_DEPTH = 4
+
+
+def git_blob_sha(path):
+    """Return the git blob SHA-1 of a file's raw bytes, as `git hash-object --no-filters` would."""
+    digest = hashlib.sha1(b"blob %d\0" % os.path.getsize(path))
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def find_initialized_projects(parent_dirs, max_depth=DEFAULT_SCAN_DEPTH):
+    """Yield the directories under parent_dirs that contain a template origin record."""
+    for parent_dir in parent_dirs:
+        stack = [(os.path.abspath(parent_dir), 0)]
+        while stack:
+            directory, depth = stack.pop()
+            if os.path.isfile(os.path.join(directory, ORIGIN_FILE)):
+                yield directory
+                continue  # projects are not nested
+            if depth >= max_depth:
+                continue
+            try:
+                with os.scandir(directory) as entries:
+                    subdirs = [entry.path for entry in entries
+                               if entry.name not in SCAN_SKIP_DIRS and entry.is_dir(follow_symlinks=False)]
+            except OSError:
+                continue
+            stack.extend((subdir, depth + 1) for subdir in sorted(subdirs, reverse=True))
+
+
+class ScanIndex:
+    """Incremental index of file blob hashes keyed on path, mtime and size.
+
+    A file whose size and mtime match its index entry is not read again on
+    the next scan. The hashes are normalized the way git would hash the
+    file (line endings converted), not hashes of the raw bytes.
+    """
+
+    version = 2
+
+    def __init__(self, path):
+        self.path = path
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        # Older indexes held raw-byte hashes, which are wrong for autocrlf checkouts
+        self.entries = data.get('entries', {}) if data.get('version') == self.version else {}
+
+    def lookup(self, path, st):
+        """Return the indexed blob SHA for path if its stat metadata is unchanged, else None."""
+        entry = self.entries.get(path)
+        if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            return entry[2]
+        return None
+
+    def save(self, scanned_roots, entries):
+        """Replace the entries under scanned_roots with entries and write the index."""
+        roots = tuple(os.path.join(root, '') for root in scanned_roots)
+        self.entries = {path: entry for path, entry in self.entries.items() if not path.startswith(roots)}
+        self.entries.update(entries)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        # A unique temporary file, as other scans may be saving at the same time
+        fd, tmp_path = tempfile.mkstemp(prefix='scan_index.', suffix='.tmp', dir=os.path.dirname(self.path))
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'version': self.version, 'entries': self.entries}, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
+class ProjectDrift:
+    """How far one initialized project is from its template."""
+
+    def __init__(self, path, record):
+        self.path = path
+        self.template_url = record['template_url']
+        self.commit = record['commit']
+        self.behind = None            # template commits made since the project's commit
+        self.upstream_changed = None  # template files changed since the project's commit
+        self.modified = []            # template files edited in the project
+        self.deleted = []             # template files removed from the project
+        self.error = None
+
+    @property
+    def is_behind(self):
+        return bool(self.behind)
+
+
+def compare_project_files(project_dir, template_blobs, index, git_backend):
+    """Compare a project's copies of the template files with the template's blobs.
+
+    Files not in the index are hashed in one batch by git_backend, using the
+    project's own line-ending settings. Returns (modified, deleted,
+    index_entries, hashed_count).
+    """
+    modified, deleted, entries = [], [], {}
+    to_hash = []
+    for rel_path, blob in template_blobs.items():
+        full_path = os.path.join(project_dir, *rel_path.split('/'))
+        try:
+            st = os.stat(full_path)
+        except OSError:
+            deleted.append(rel_path)
+            continue
+        sha = index.lookup(full_path, st)
+        if sha is None:
+            to_hash.append((rel_path, full_path, st))
+            continue
+        entries[full_path] = [st.st_size, st.st_mtime_ns, sha]
+        if sha != blob:
+            modified.append(rel_path)
+    
+    shas = git_backend.hash_files(project_dir, [rel_path for rel_path, _, _ in to_hash])
+    for (rel_path, full_path, st), sha in zip(to_hash, shas):
+        entries[full_path] = [st.st_size, st.st_mtime_ns, sha]
+        if sha != template_blobs[rel_path]:
+            modified.append(rel_path)
+    return sorted(modified), sorted(deleted), entries, len(to_hash)
+
+
+class DriftScanResult:
+    """Outcome of scan_projects()."""
+
+    def __init__(self, projects, files_checked, files_hashed, elapsed):
+        self.projects = projects
+        self.files_checked = files_checked
+        self.files_hashed = files_hashed
+        self.elapsed = elapsed
+
+
+def update_template_history(repo_url, cache_dir, git_backend, log=print, attempts=DEFAULT_RETRY_ATTEMPTS):
+    """Return the path of an up-to-date bare clone of repo_url kept in cache_dir.
+
+    The clone or fetch is retried with jittered exponential backoff.
+    """
+    history_dir = os.path.join(cache_dir, 'history',
+                               hashlib.sha1(repo_url.encode('utf-8')).hexdigest()[:16] + '.git')
+    
+    def on_retry(event):
+        log(f"Warning: {event.phase} attempt {event.attempt} of template history failed: {event.error}")
+        log(f"Retrying in {event.delay:.1f} seconds...")
+        if event.phase == 'clone':
+            shutil.rmtree(history_dir, ignore_errors=True)
+    
+    if os.path.isdir(history_dir):
+        try:
+            retry_with_backoff(lambda: git_backend.fetch(history_dir, repo_url), 'fetch', attempts,
+                               retry_on=(GitBackendError,), on_retry=on_retry)
+        except GitBackendError as e:
+            log(f"Warning: Could not update template history from {repo_url}: {e}. Using cached history.")
+    else:
+        log(f"Fetching template history from {repo_url}...")
+        os.makedirs(os.path.dirname(history_dir), exist_ok=True)
+        retry_with_backoff(lambda: git_backend.clone(repo_url, history_dir, bare=True), 'clone', attempts,
+                           retry_on=(GitBackendError,), on_retry=on_retry)
+    return history_dir
+
+
+def scan_projects(parent_dirs, git_backend=None, cache_dir=None, max_depth=DEFAULT_SCAN_DEPTH,
+                  max_workers=None, log=print, attempts=DEFAULT_RETRY_ATTEMPTS):
+    """Find initialized projects under parent_dirs and measure their drift from the template.
+
+    Template trees are listed once per distinct recorded commit from a bare
+    clone of the template kept in cache_dir. Project files are compared per
+    project across a thread pool, reusing the blob hashes in an incremental
+    index for files whose size and mtime are unchanged.
+    """
+    start = time.perf_counter()
+    git_backend = git_backend or SubprocessGitBackend()
+    cache_dir = cache_dir or get_cache_home()
+    parent_dirs = [os.path.abspath(d) for d in parent_dirs]
+    
+    projects = []
+    for project_dir in find_initialized_projects(parent_dirs, max_depth):
+        record = read_origin_record(project_dir)
+        if record:
+            projects.append(ProjectDrift(project_dir, record))
     
-    return True
+    # Template side: one history update per template, one tree listing per commit.
+    # Failures are stored too, so they are reported per project but not retried.
+    history = {}
+    trees = {}
+    for project in projects:
+        url = project.template_url
+        if url not in history:
+            try:
+                history_dir = update_template_history(url, cache_dir, git_backend, log, attempts)
+                tip = git_backend.head_commit(history_dir)
+                history[url] = (history_dir, tip, git_backend.ls_tree(history_dir, tip))
+            except GitBackendError as e:
+                history[url] = GitBackendError(f"Template history unavailable: {e}")
+        if isinstance(history[url], GitBackendError):
+            project.error = str(history[url])
+            continue
+        
+        history_dir, tip, tip_blobs = history[url]
+        key = (url, project.commit)
+        if key not in trees:
+            try:
+                blobs = git_backend.ls_tree(history_dir, project.commit)
+                behind = git_backend.count_commits(history_dir, project.commit, tip)
+            except GitBackendError as e:
+                trees[key] = GitBackendError(f"Template commit {project.commit[:12]} not found: {e}")
+            else:
+                changed = sum(1 for path in set(blobs) | set(tip_blobs) if blobs.get(path) != tip_blobs.get(path))
+                trees[key] = (blobs, behind, changed)
+        if isinstance(trees[key], GitBackendError):
+            project.error = str(trees[key])
+            continue
+        _, project.behind, project.upstream_changed = trees[key]
+    
+    # Project side: compare files in parallel
+    index = ScanIndex(os.path.join(cache_dir, 'scan_index.json'))
+    index_entries = {}
+    files_checked = files_hashed = 0
+    comparable = [p for p in projects if p.error is None]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(compare_project_files, p.path, trees[(p.template_url, p.commit)][0], index, git_backend): p
+            for p in comparable
+        }
+        for future in concurrent.futures.as_completed(futures):
+            project = futures[future]
+            try:
+                project.modified, project.deleted, entries, hashed = future.result()
+            except (OSError, GitBackendError) as e:
+                project.error = str(e)
+                continue
+            index_entries.update(entries)
+            files_checked += len(entries)
+            files_hashed += hashed
+    try:
+        index.save(parent_dirs, index_entries)
+    except OSError as e:
+        log(f"Warning: Could not save scan index: {e}")
+    
+    projects.sort(key=lambda p: (p.behind is None, -(p.behind or 0), p.path))
+    return DriftScanResult(projects, files_checked, files_hashed, time.perf_counter() - start)
+
+
+def print_drift_report(result):
+    """Print a drift scan report, most outdated projects first."""
+    projects = result.projects
+    print(f"Scanned {len(projects)} projects in {result.elapsed:.2f}s "
+          f"({result.files_hashed} of {result.files_checked} files hashed)")
+    if not projects:
+        print("No initialized projects found.")
+        return
+    
+    width = max(len("PROJECT"), max(len(p.path) for p in projects))
+    print(f"{'PROJECT':<{width}}  {'COMMIT':<12}  {'BEHIND':>6}  {'UPSTREAM':>8}  {'MODIFIED':>8}  {'DELETED':>7}")
+    for p in projects:
+        if p.error:
+            print(f"{p.path:<{width}}  {p.commit[:12]:<12}  error: {p.error}")
+            continue
+        print(f"{p.path:<{width}}  {p.commit[:12]:<12}  {p.behind:>6}  {p.upstream_changed:>8}  "
+              f"{len(p.modified):>8}  {len(p.deleted):>7}")
+    
+    behind = sum(1 for p in projects if p.is_behind)
+    errors = sum(1 for p in projects if p.error)
+    print(f"\n{behind} of {len(projects) - errors} checked projects are behind their template.")
+    if errors:
+        print(f"{errors} of {len(projects)} projects could not be checked; their drift is unknown.")
+    print("BEHIND: template commits since the project was created; UPSTREAM: template files changed since then;")
+    print("MODIFIED/DELETED: template files changed or removed in the project.")
+
+
+def parse_scan_arguments(argv):
+    """Parse the arguments of the scan command."""
+    parser = argparse.ArgumentParser(
+        prog="project_initializer.py scan",
+        description="Find projects created by this tool and report how far they have drifted from the template."
+    )
+    parser.add_argument('parent_dirs', nargs='+', metavar='DIR', help='Directories to search for projects')
+    parser.add_argument('--max-depth', type=int, default=DEFAULT_SCAN_DEPTH,
+                        help=f'How many directory levels below each DIR to search (default: {DEFAULT_SCAN_DEPTH})')
+    parser.add_argument('--workers', type=int, help='Number of projects to compare in parallel')
+    parser.add_argument('--cache-dir', help='Where to keep template history and the scan index '
+                                            '(default: the per-user cache directory)')
+    parser.add_argument('--git-backend', choices=sorted(GIT_BACKENDS) + ['auto'], default='subprocess',
+                        help='Git implementation to use (default: subprocess)')
+    parser.add_argument('--retries', type=int, default=DEFAULT_RETRY_ATTEMPTS - 1,
+                        help=f'Number of times to retry fetching template history '
+                             f'(default: {DEFAULT_RETRY_ATTEMPTS - 1})')
+    return parser.parse_args(argv)
+
+
+def print_git_unavailable(git_backend):
+    """Explain how to make the selected git backend available."""
+    if git_backend.name == "dulwich":
+        print("Error: The dulwich git backend is not installed.")
+        print("Install it with 'pip install dulwich' or use --git-backend subprocess.")
+    else:
+        print("Error: Git is not installed or not available in PATH.")
+        print("Please install Git and try again.")
+
+
+def scan_main(argv):
+    """Entry point of the scan command."""
+    args = parse_scan_arguments(argv)
+    git_backend = get_git_backend(args.git_backend)
+    if not check_git_installed(git_backend):
+        print_git_unavailable(git_backend)
+        sys.exit(1)
+    result = scan_projects(args.parent_dirs, git_backend, args.cache_dir, args.max_depth, args.workers,
+                           attempts=max(args.retries, 0) + 1)
+    print_drift_report(result)
+    if any(p.error for p in result.projects):
+        sys.exit(1)
+
+
+def print_retry_summary(retry_events):
+    """Print the retries that were needed, if any."""
+    if not retry_events:
+        return
+    print(f"Retries needed: {len(retry_events)}")
+    for event in retry_events:
+        print(f"  - {event}")
 
 
 def parse_arguments():
@@ -251,6 +2029,9 @@ Examples:
   python project_initializer.py "my-app" "C:\\Projects"
   python project_initializer.py "new-project" "D:\\Development"
   python project_initializer.py "test-app" "."
+
+Drift scan of existing projects:
+  python project_initializer.py scan "C:\\Projects" "D:\\Development"
         """
     )
     
@@ -264,11 +2045,70 @@ Examples:
         help='Path where the project directory should be created (REQUIRED) - can be relative or absolute'
     )
     
+    parser.add_argument(
+        '--git-backend',
+        choices=sorted(GIT_BACKENDS) + ['auto'],
+        default='subprocess',
+        help='Git implementation to use: the git command line tool (default), '
+             'in-process dulwich, or auto (dulwich if installed)'
+    )
+    
+    parser.add_argument(
+        '--cache-dir',
+        help='Cache the template in this directory and copy it from there (verified against '
+             'an integrity manifest) instead of cloning over the network each time'
+    )
+    
+    parser.add_argument(
+        '--mirror',
+        action='append',
+        default=[],
+        metavar='URL',
+        help='Additional mirror of the template repository (repeatable). All mirrors are probed '
+             'concurrently and the template is cloned from the fastest one'
+    )
+    
+    parser.add_argument(
+        '--expected-sha',
+        help='Only clone from a mirror whose default branch is at this commit'
+    )
+    
+    parser.add_argument(
+        '--stall-timeout',
+        type=float,
+        help='Stop git or bootstrap after this many seconds without output or filesystem '
+             f'progress (default: {DEFAULT_PHASE_LIMITS["clone"].stall_timeout:g}, 0 disables)'
+    )
+    
+    parser.add_argument(
+        '--clone-deadline',
+        type=float,
+        help=f'Maximum seconds per clone attempt (default: {DEFAULT_PHASE_LIMITS["clone"].deadline:g}, 0 disables)'
+    )
+    
+    parser.add_argument(
+        '--bootstrap-deadline',
+        type=float,
+        help=f'Maximum seconds for the bootstrap script (default: {DEFAULT_PHASE_LIMITS["bootstrap"].deadline:g}, '
+             '0 disables)'
+    )
+    
+    parser.add_argument(
+        '--retries',
+        type=int,
+        default=DEFAULT_RETRY_ATTEMPTS - 1,
+        help=f'Number of times to retry a failed or stalled clone (default: {DEFAULT_RETRY_ATTEMPTS - 1})'
+    )
+    
     return parser.parse_args()
 
 
 def main():
     """Main function to orchestrate the project initialization."""
+    if len(sys.argv) > 1 and sys.argv[1] == 'scan':
+        scan_main(sys.argv[2:])
+        return
+    
     print("=== Project Initializer Script ===")
     print("Initializing Fullstack-boilerplate project...")
     
@@ -279,64 +2119,53 @@ def main():
     project_name = args.project_name
     project_path = args.project_path
     
-    # Validate project name
-    if not validate_project_name(project_name):
-        print("Invalid project name. Exiting.")
-        sys.exit(1)
+    session = Initializer(mirror_urls=args.mirror, git_backend=args.git_backend, cache_dir=args.cache_dir,
+                          phase_limits=build_phase_limits(args.stall_timeout, args.clone_deadline,
+                                                          args.bootstrap_deadline),
+                          retries=max(args.retries, 0), expected_commit=args.expected_sha,
+                          log=print, on_output=print_output)
     
-    # Validate project path
-    if not validate_project_path(project_path):
-        print("Invalid project path. Exiting.")
+    # Validate project name and path
+    errors = session.validate(project_name, project_path)
+    if errors:
+        for error in errors:
+            print(f"Error: {error}")
+        print("Invalid project name or path. Exiting.")
         sys.exit(1)
     
-    # Construct the full project directory path
-    if os.path.isabs(project_path):
-        # Absolute path
-        full_project_dir = os.path.join(project_path, project_name)
-    else:
-        # Relative path - convert to absolute
-        full_project_dir = os.path.abspath(os.path.join(project_path, project_name))
-    
+    full_project_dir = get_full_project_dir(project_name, project_path)
     print(f"Project name: {project_name}")
     print(f"Project path: {project_path}")
     print(f"Full project directory: {full_project_dir}")
     
-    # Create the project directory if it doesn't exist
-    try:
-        os.makedirs(full_project_dir, exist_ok=True)
-        print(f"Project directory created/verified: {full_project_dir}")
-    except Exception as e:
-        print(f"Error creating project directory: {e}")
+    # Check if git is installed and determine OS type
+    system = session.check_system()
+    if not system.git_available:
+        print_git_unavailable(session.git_backend)
         sys.exit(1)
+    print(f"Using git backend: {session.git_backend.name}")
+    print(f"Detected operating system: {system.os_name} ({system.os_type})")
     
-    # Configuration
-    repo_url = "https://github.com/Kicchu02/Fullstack-boilerplate.git"
-    
-    # Check if git is installed
-    if not check_git_installed():
-        print("Error: Git is not installed or not available in PATH.")
-        print("Please install Git and try again.")
-        sys.exit(1)
-    
-    # Determine OS type
-    os_type = get_os_type()
-    print(f"Detected operating system: {platform.system()} ({os_type})")
-    
-    if os_type == "unknown":
+    if system.os_type == "unknown":
         print("Warning: Unknown operating system. Bootstrap execution may fail.")
     
-    # Clone the repository
-    if not clone_repository(repo_url, full_project_dir):
-        print("Failed to clone repository. Exiting.")
-        sys.exit(1)
-    
-    # Execute the appropriate bootstrap file
-    if not execute_bootstrap(full_project_dir, os_type):
-        print("Bootstrap execution failed. Exiting.")
+    result = session.initialize(project_name, project_path)
+    if not result.success:
+        print(f"Error: {result.error}")
+        if result.error_details:
+            print(f"Details: {result.error_details}")
+        print_retry_summary(result.retries)
+        if result.failed_phase == 'clone':
+            print("Failed to clone repository. Exiting.")
+        elif result.failed_phase == 'bootstrap':
+            print("Bootstrap execution failed. Exiting.")
+        else:
+            print("Project initialization failed. Exiting.")
         sys.exit(1)
     
     print("\n=== Project initialization completed successfully! ===")
     print(f"Your project is ready in the '{full_project_dir}' directory.")
+    print_retry_summary(result.retries)
     print("You can now start developing your full-stack application!")
 
 
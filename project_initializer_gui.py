@@ -4,19 +4,88 @@ Project Initializer Script - GUI Version
 A simple GUI interface for cloning the Fullstack-boilerplate repository and executing the appropriate bootstrap file.
 """
 
+import time
+
+STARTUP_TIME = time.perf_counter()
+
 import os
 import sys
-import subprocess
-import platform
-import shutil
+import json
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
-from pathlib import Path
+from tkinter import ttk, messagebox
 import threading
+import argparse
+
+from initializer_paths import get_cache_home
+
+# subprocess, shutil, tkinter.filedialog and the project_initializer engine
+# (which pulls in subprocess, hashlib and concurrent.futures) are imported
+# lazily so they do not delay the first frame.
+
+SYSTEM_CHECK_CACHE_VERSION = 1
+
+# Live preflight: wait this long after the last keystroke, and reuse results per path for this long
+PREFLIGHT_DEBOUNCE_MS = 300
+PREFLIGHT_CACHE_SECONDS = 30
+
+
+def load_engine():
+    """Import the shared project_initializer engine on first use."""
+    import project_initializer
+    return project_initializer
+
+
+def get_file_mtime_ns(path):
+    """Return the mtime of path in nanoseconds, or None if it does not exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except (OSError, TypeError):
+        return None
+
+
+def load_system_checks(git_backend_name):
+    """Return cached system check results if they are still valid, else None.
+
+    The cache is keyed by PATH, the git backend, and the path and mtime of
+    the git binary found last time, so validating it costs a single stat().
+    """
+    try:
+        with open(os.path.join(get_cache_home(), 'system_checks.json')) as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if (cached.get('version') != SYSTEM_CHECK_CACHE_VERSION
+            or cached.get('path_env') != os.environ.get('PATH', '')
+            or cached.get('git_backend') != git_backend_name
+            or cached.get('git_mtime_ns') != get_file_mtime_ns(cached.get('git_path'))):
+        return None
+    return cached
+
+
+def save_system_checks(results):
+    """Write system check results to the on-disk cache (best effort)."""
+    import tempfile
+    cache_home = get_cache_home()
+    cache_path = os.path.join(cache_home, 'system_checks.json')
+    try:
+        os.makedirs(cache_home, exist_ok=True)
+        # A unique temporary file, as several GUI instances may be saving at the same time
+        fd, tmp_path = tempfile.mkstemp(prefix='system_checks.', suffix='.tmp', dir=cache_home)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(dict(results, version=SYSTEM_CHECK_CACHE_VERSION), f)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    except OSError as e:
+        print(f"Warning: Could not write system check cache: {e}")
 
 
 class ProjectInitializerGUI:
-    def __init__(self, root):
+    def __init__(self, root, git_backend_name="subprocess", cache_dir=None, mirror_urls=None):
         """Initialize the GUI."""
         self.root = root
         self.root.title("Project Initializer")
@@ -27,12 +96,27 @@ class ProjectInitializerGUI:
         self.project_path = tk.StringVar(value="")
         self.repo_url = "https://github.com/Kicchu02/Fullstack-boilerplate.git"
         self.git_installed = False  # Initialize git_installed attribute
+        self.git_backend_name = git_backend_name
+        self.cache_dir = cache_dir
+        self.mirror_urls = [self.repo_url] + [url for url in mirror_urls or [] if url != self.repo_url]
+        self._session = None
+        self._session_lock = threading.Lock()
+        self.system_checks = None  # Results shown in the UI, set once known
+        self.system_checks_ready_time = None
+        self._preflight_after_id = None
+        self._preflight_cache = {}  # full project dir -> (time.monotonic(), PreflightResult)
+        self._preflight_running = set()
         
         # Create widgets
         self.create_widgets()
         
-        # Start system checks
-        self.check_git_async()
+        # Use cached system checks for an instant start, then revalidate in the background
+        # once the window is on screen: the check imports the engine, which would
+        # otherwise compete with Tk for the first frame
+        cached = load_system_checks(self.git_backend_name)
+        if cached:
+            self.apply_system_checks(cached, from_cache=True)
+        self._map_binding = self.root.bind('<Map>', self.on_first_map, '+')
         
         # Initial validation to set button state
         self.validate_inputs()
@@ -41,6 +125,28 @@ class ProjectInitializerGUI:
         self.root.update_idletasks()
         self.root.geometry("")  # Let Tkinter calculate optimal size
     
+    def on_first_map(self, event):
+        """Start the background system checks once the main window has been shown."""
+        if event.widget is not self.root:
+            return  # <Map> of a child widget, delivered through the toplevel's bind tag
+        self.root.unbind('<Map>', self._map_binding)
+        self.root.after_idle(self.check_git_async)
+    
+    @property
+    def session(self):
+        """The engine's Initializer session, created (and the engine imported) on first use.
+
+        The session keeps the git backend, template cache and system checks
+        warm for every project created from this window.
+        """
+        with self._session_lock:
+            if self._session is None:
+                self._session = load_engine().Initializer(
+                    repo_url=self.repo_url, mirror_urls=self.mirror_urls, git_backend=self.git_backend_name,
+                    cache_dir=self.cache_dir,
+                    log=lambda message: self.root.after(0, lambda: self.update_status(message)))
+            return self._session
+    
     def create_widgets(self):
         """Create and arrange GUI widgets."""
         # Main frame with padding
@@ -99,6 +205,12 @@ class ProjectInitializerGUI:
         self.system_status_label = ttk.Label(os_frame, text="Checking...", font=("Arial", 10), foreground="orange")
         self.system_status_label.grid(row=2, column=1, sticky=tk.W, padx=(15, 0), pady=5)
         
+        # Live preflight of the target directory
+        ttk.Label(os_frame, text="Target Check:", font=("Arial", 10, "bold")).grid(row=3, column=0, sticky=tk.W, pady=5)
+        self.preflight_label = ttk.Label(os_frame, text="Enter a project name and path", font=("Arial", 10),
+                                         foreground="gray", wraplength=450)
+        self.preflight_label.grid(row=3, column=1, sticky=tk.W, padx=(15, 0), pady=5)
+        
         # Progress Bar
         self.progress = ttk.Progressbar(main_frame, mode='indeterminate')
         self.progress.pack(fill="x", pady=(0, 20))
@@ -126,21 +238,19 @@ class ProjectInitializerGUI:
         # Bind Escape key to Quit
         self.root.bind('<Escape>', lambda event: self.root.quit())
         
-        # Bind input validation to entry fields
-        self.name_entry.bind('<KeyRelease>', self.validate_inputs)
-        self.dir_entry.bind('<KeyRelease>', self.validate_inputs)
-        self.project_name.trace('w', self.validate_inputs)
-        self.project_path.trace('w', self.validate_inputs)
+        # Bind input validation to entry fields (the variable traces fire once per edit)
+        self.project_name.trace('w', self.on_inputs_changed)
+        self.project_path.trace('w', self.on_inputs_changed)
     
     def browse_directory(self):
         """Open directory browser dialog."""
+        from tkinter import filedialog
         directory = filedialog.askdirectory(
             title="Select Project Directory",
             initialdir=os.getcwd()
         )
         if directory:
-            self.project_path.set(directory)
-            self.validate_inputs()  # Re-validate after setting path
+            self.project_path.set(directory)  # Re-validates through the variable trace
     
     def validate_inputs(self, *args):
         """Validate input fields and enable/disable Initialize button accordingly."""
@@ -157,6 +267,79 @@ class ProjectInitializerGUI:
         else:
             self.init_btn.config(state="disabled")
     
+    def on_inputs_changed(self, *args):
+        """Re-validate the inputs and schedule a debounced preflight of the target."""
+        self.validate_inputs()
+        if self._preflight_after_id is not None:
+            self.root.after_cancel(self._preflight_after_id)
+        self._preflight_after_id = self.root.after(PREFLIGHT_DEBOUNCE_MS, self.run_preflight)
+    
+    def get_full_project_dir(self):
+        """Return the absolute project directory from the inputs, or None if either is empty."""
+        project_name = self.project_name.get().strip()
+        project_path = self.project_path.get().strip()
+        if not project_name or not project_path:
+            return None
+        if os.path.isabs(project_path):
+            return os.path.join(project_path, project_name)
+        return os.path.abspath(os.path.join(project_path, project_name))
+    
+    def get_cached_preflight(self, full_project_dir):
+        """Return a recent preflight result for the directory, or None."""
+        cached = self._preflight_cache.get(full_project_dir)
+        if cached and time.monotonic() - cached[0] < PREFLIGHT_CACHE_SECONDS:
+            return cached[1]
+        return None
+    
+    def run_preflight(self):
+        """Check the current target directory in the background (never blocks the Tk loop)."""
+        self._preflight_after_id = None
+        full_project_dir = self.get_full_project_dir()
+        if not full_project_dir:
+            self.preflight_label.config(text="Enter a project name and path", foreground="gray")
+            return
+        
+        cached = self.get_cached_preflight(full_project_dir)
+        if cached:
+            self.show_preflight(cached)
+            return
+        
+        self.preflight_label.config(text="Checking target...", foreground="orange")
+        if full_project_dir in self._preflight_running:
+            return
+        self._preflight_running.add(full_project_dir)
+        
+        def check():
+            try:
+                result = self.session.preflight(full_project_dir)
+            except Exception as e:
+                result = None
+                print(f"Preflight check failed: {e}")
+            self.root.after(0, lambda: self.on_preflight_done(full_project_dir, result))
+        
+        thread = threading.Thread(target=check, daemon=True)
+        thread.start()
+    
+    def on_preflight_done(self, full_project_dir, result):
+        """Store a finished preflight result and show it if the inputs still point at it."""
+        self._preflight_running.discard(full_project_dir)
+        if result is None:
+            self.preflight_label.config(text="Could not check target", foreground="orange")
+            return
+        self._preflight_cache[full_project_dir] = (time.monotonic(), result)
+        if self.get_full_project_dir() == full_project_dir:
+            self.show_preflight(result)
+    
+    def show_preflight(self, result):
+        """Display a preflight result."""
+        if result.errors:
+            color = "red"
+        elif result.warnings:
+            color = "orange"
+        else:
+            color = "green"
+        self.preflight_label.config(text=result.summary(), foreground=color)
+    
     def update_status(self, message):
         """Update status label and log to console."""
         self.status_label.config(text=message)
@@ -169,307 +352,202 @@ class ProjectInitializerGUI:
         project_name = self.project_name.get().strip()
         project_path = self.project_path.get().strip()
         
-        # Validate inputs
-        if not project_name:
-            messagebox.showerror("Error", "Please enter a valid project name.")
-            return
-            
-        if not project_path:
-            messagebox.showerror("Error", "Please enter a valid project path.")
-            return
-        
-        # Validate project name
-        if not self.validate_project_name(project_name):
-            return
-        
-        # Validate project path
-        if not self.validate_project_path(project_path):
+        # Validate project name and path
+        errors = self.session.validate(project_name, project_path)
+        if errors:
+            messagebox.showerror("Error", errors[0])
             return
         
         # Construct the full project directory path
-        if os.path.isabs(project_path):
-            full_project_dir = os.path.join(project_path, project_name)
-        else:
-            full_project_dir = os.path.abspath(os.path.join(project_path, project_name))
+        full_project_dir = self.get_full_project_dir()
         
         # Disable the initialize button to prevent multiple clicks
         self.init_btn.config(state="disabled")
         self.progress.start()
         
+        # Preflight findings must be confirmed before any work starts. Without a
+        # fresh result (expired, or still debouncing) the target is checked now.
+        preflight = self.get_cached_preflight(full_project_dir)
+        if preflight:
+            self.confirm_preflight(project_name, project_path, full_project_dir, preflight)
+            return
+        
+        self.update_status("Checking target...")
+        
+        def check():
+            try:
+                result, error = self.session.preflight(full_project_dir), None
+            except Exception as e:
+                result, error = None, e
+            self.root.after(0, lambda: self.confirm_preflight(project_name, project_path, full_project_dir,
+                                                              result, error))
+        
+        thread = threading.Thread(target=check, daemon=True)
+        thread.start()
+    
+    def confirm_preflight(self, project_name, project_path, full_project_dir, preflight, error=None):
+        """Show preflight findings and start initialization once they are accepted."""
+        if preflight is None:
+            message = f"Could not check the target directory: {error}\n\nDo you want to continue?"
+            if not messagebox.askyesno("Warning", message):
+                self.cancel_initialization()
+                return
+        else:
+            self.on_preflight_done(full_project_dir, preflight)
+            if preflight.errors:
+                messagebox.showerror("Error", "\n".join(preflight.errors))
+                self.cancel_initialization()
+                return
+            if preflight.warnings:
+                message = "\n".join(preflight.warnings) + "\n\nDo you want to continue?"
+                if not messagebox.askyesno("Warning", message):
+                    self.cancel_initialization()
+                    return
+        
         # Start initialization in a separate thread
         thread = threading.Thread(target=self._initialize_project_thread, 
-                                args=(full_project_dir,), daemon=True)
+                                args=(project_name, project_path, full_project_dir, preflight), daemon=True)
         thread.start()
     
-    def _initialize_project_thread(self, full_project_dir):
+    def cancel_initialization(self):
+        """Restore the controls after initialization was declined before it started."""
+        self.update_status("Initialization cancelled")
+        self.init_btn.config(state="normal")
+        self.progress.stop()
+    
+    def _initialize_project_thread(self, project_name, project_path, full_project_dir, preflight):
         """Thread function for project initialization."""
         try:
-            # Create project directory
-            os.makedirs(full_project_dir, exist_ok=True)
-            self.root.after(0, lambda: self.update_status(f"Project directory created: {full_project_dir}"))
+            result = self.session.initialize(project_name, project_path, preflight=preflight)
+            summary = self.format_retry_summary(result.retries)
             
-            # Clone repository
-            if not self.clone_repository(self.repo_url, full_project_dir):
-                self.root.after(0, lambda: messagebox.showerror("Error", "Failed to clone repository"))
-                return
-            
-            # Execute bootstrap
-            os_type = self.get_os_type()
-            if not self.execute_bootstrap(full_project_dir, os_type):
-                self.root.after(0, lambda: messagebox.showerror("Error", "Bootstrap execution failed"))
+            if not result.success:
+                if result.failed_phase == 'clone':
+                    message = f"Failed to clone repository: {result.error}{summary}"
+                elif result.failed_phase == 'bootstrap':
+                    message = f"Bootstrap execution failed: {result.error}"
+                else:
+                    message = result.error
+                self.root.after(0, lambda: messagebox.showerror("Error", message))
                 return
             
             # Success
             self.root.after(0, lambda: self.update_status("Project initialization completed successfully!"))
             self.root.after(0, lambda: messagebox.showinfo("Success", 
-                f"Project initialized successfully!\n\nYour project is ready in:\n{full_project_dir}"))
+                f"Project initialized successfully!\n\nYour project is ready in:\n{full_project_dir}{summary}"))
             
         except Exception as e:
             self.root.after(0, lambda: self.update_status(f"Error: {e}"))
             self.root.after(0, lambda: messagebox.showerror("Error", f"Unexpected error: {e}"))
         finally:
+            # The target has changed, so any preflight result for it is stale
+            self.root.after(0, lambda: self._preflight_cache.pop(full_project_dir, None))
             # Re-enable the initialize button and stop progress
             self.root.after(0, lambda: self.init_btn.config(state="normal"))
             self.root.after(0, lambda: self.progress.stop())
     
-    def validate_project_name(self, project_name):
-        """Validate the project name."""
-        # Check for invalid characters
-        invalid_chars = '<>:"|?*\\/'
-        if any(char in project_name for char in invalid_chars):
-            messagebox.showerror("Error", f"Project name contains invalid characters: {invalid_chars}")
-            return False
-        
-        # Check for reserved names
-        reserved_names = ['.', '..', 'CON', 'PRN', 'AUX', 'NUL', 'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9', 'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9']
-        if project_name.upper() in [name.upper() for name in reserved_names]:
-            messagebox.showerror("Error", f"Cannot use reserved name: {project_name}")
-            return False
-        
-        return True
-    
-    def validate_project_path(self, project_path):
-        """Validate the project path."""
-        # Check for invalid characters
-        invalid_chars = '<>|?*'
-        if any(char in project_path for char in invalid_chars):
-            messagebox.showerror("Error", f"Project path contains invalid characters: {invalid_chars}")
-            return False
-        
-        # Check if the path is accessible for creation
-        try:
-            if os.path.isabs(project_path):
-                # Absolute path - check if parent directory is writable
-                parent_dir = project_path
-            else:
-                # Relative path - check if current directory is writable
-                parent_dir = os.getcwd()
-            
-            if not os.access(parent_dir, os.W_OK):
-                messagebox.showerror("Error", f"Cannot write to directory: {parent_dir}")
-                return False
-        except Exception as e:
-            messagebox.showerror("Error", f"Error validating project path: {e}")
-            return False
-        
-        return True
-    
-    def clone_repository(self, repo_url, target_dir):
-        """Clone the repository to the target directory."""
-        self.update_status(f"Cloning repository from {repo_url}...")
-        
-        if os.path.exists(target_dir):
-            self.update_status(f"Directory {target_dir} already exists. Removing it...")
-            shutil.rmtree(target_dir)
-        
-        try:
-            # Clone with verbose output to see what's happening
-            result = subprocess.run(['git', 'clone', '--verbose', repo_url, target_dir], 
-                                  check=True, capture_output=True, text=True)
-            
-            # Verify the clone actually worked by checking if files exist
-            if os.path.exists(target_dir) and os.listdir(target_dir):
-                items = os.listdir(target_dir)
-                self.update_status(f"Repository cloned successfully to {target_dir}")
-                self.update_status(f"Cloned {len(items)} items: {', '.join(items[:5])}{'...' if len(items) > 5 else ''}")
-                
-                # Check for key files
-                expected_files = ['README.md', 'bootstrap.bat', 'bootstrap.sh']
-                found_files = [f for f in expected_files if os.path.exists(os.path.join(target_dir, f))]
-                if found_files:
-                    self.update_status(f"Found key files: {', '.join(found_files)}")
-                else:
-                    self.update_status("Warning: No expected key files found")
-                
-                # Remove existing Git repository and initialize new one
-                self.update_status("Removing existing Git repository...")
-                git_dir = os.path.join(target_dir, '.git')
-                if os.path.exists(git_dir):
-                    try:
-                        # Use OS-specific commands to remove Git repository
-                        if platform.system().lower() == "windows":
-                            # Windows: Use rmdir with /s /q for recursive deletion
-                            subprocess.run(['rmdir', '/s', '/q', git_dir], shell=True, check=True, capture_output=True)
-                            self.update_status("Existing Git repository removed successfully (Windows)")
-                        else:
-                            # Linux/Mac: Use rm -rf
-                            subprocess.run(['rm', '-rf', git_dir], check=True, capture_output=True)
-                            self.update_status("Existing Git repository removed successfully (Unix)")
-                    except subprocess.CalledProcessError as e:
-                        self.update_status(f"Warning: Could not remove existing Git repository: {e}")
-                        # Try alternative method
-                        try:
-                            if platform.system().lower() == "windows":
-                                # Windows: Force delete using PowerShell
-                                ps_command = f'Remove-Item -Path "{git_dir}" -Recurse -Force'
-                                subprocess.run(['powershell', '-Command', ps_command], check=True, capture_output=True)
-                                self.update_status("Existing Git repository removed successfully (PowerShell)")
-                            else:
-                                # Linux/Mac: Use find and rm
-                                subprocess.run(['find', git_dir, '-type', 'f', '-exec', 'rm', '-f', '{}', '+'], check=True, capture_output=True)
-                                subprocess.run(['find', git_dir, '-type', 'd', '-exec', 'rmdir', '{}', '+'], check=True, capture_output=True)
-                                self.update_status("Existing Git repository removed successfully (find/rm)")
-                        except Exception as e2:
-                            self.update_status(f"Warning: Alternative removal method also failed: {e2}")
-                            self.update_status("Continuing with existing Git repository...")
-                
-                # Initialize new Git repository
-                self.update_status("Initializing new Git repository...")
-                try:
-                    subprocess.run(['git', 'init'], cwd=target_dir, check=True, capture_output=True, text=True)
-                    self.update_status("New Git repository initialized successfully")
-                    
-                    # Add all files to the new repository
-                    subprocess.run(['git', 'add', '.'], cwd=target_dir, check=True, capture_output=True, text=True)
-                    self.update_status("All files added to new Git repository")
-                    
-                    # Make initial commit
-                    subprocess.run(['git', 'commit', '-m', 'Initial commit from Fullstack-boilerplate'], 
-                                 cwd=target_dir, check=True, capture_output=True, text=True)
-                    self.update_status("Initial commit created successfully")
-                    
-                except subprocess.CalledProcessError as e:
-                    self.update_status(f"Warning: Could not initialize new Git repository: {e}")
-                    if e.stderr:
-                        self.update_status(f"Git error: {e.stderr}")
-                
-                return True
-            else:
-                self.update_status(f"Clone appeared successful but directory is empty")
-                return False
-                
-        except subprocess.CalledProcessError as e:
-            self.update_status(f"Error cloning repository: {e}")
-            if e.stderr:
-                self.update_status(f"Git error: {e.stderr}")
-            return False
-        except Exception as e:
-            self.update_status(f"Unexpected error during clone: {e}")
-            return False
+    def format_retry_summary(self, retry_events):
+        """Describe the retries that were needed, for the final message box."""
+        if not retry_events:
+            return ""
+        return f"\n\nRetries needed: {len(retry_events)}\n" + "\n".join(f"- {event}" for event in retry_events)
     
-    def execute_bootstrap(self, target_dir, os_type):
-        """Execute the appropriate bootstrap file based on OS."""
-        if os_type == "windows":
-            bootstrap_file = os.path.join(target_dir, "bootstrap.bat")
-            if os.path.exists(bootstrap_file):
-                self.update_status("Executing Windows bootstrap script...")
-                try:
-                    subprocess.run(bootstrap_file, shell=True, check=True, cwd=target_dir, capture_output=True)
-                    self.update_status("Windows bootstrap completed successfully!")
-                    return True
-                except subprocess.CalledProcessError as e:
-                    self.update_status(f"Error executing Windows bootstrap: {e}")
-                    return False
-            else:
-                self.update_status(f"Windows bootstrap file not found: {bootstrap_file}")
-                return False
-        
-        elif os_type == "unix":
-            bootstrap_file = os.path.join(target_dir, "bootstrap.sh")
-            if os.path.exists(bootstrap_file):
-                self.update_status("Executing Unix bootstrap script...")
-                try:
-                    os.chmod(bootstrap_file, 0o755)
-                    subprocess.run([bootstrap_file], check=True, cwd=target_dir, capture_output=True)
-                    self.update_status("Unix bootstrap completed successfully!")
-                    return True
-                except subprocess.CalledProcessError as e:
-                    self.update_status(f"Error executing Unix bootstrap: {e}")
-                    return False
-            else:
-                self.update_status(f"Unix bootstrap file not found: {bootstrap_file}")
-                return False
-        
+    def apply_system_checks(self, results, from_cache=False):
+        """Show system check results in the UI and enable the Initialize button if ready."""
+        self.system_checks = results
+        self.os_label.config(text=f"{results['os_name']} ({results['os_type']})")
+        if results['git_installed']:
+            self.git_label.config(text="✓ Git is installed", foreground="green")
+            self.system_status_label.config(text="✓ Ready", foreground="green")
+            self.status_label.config(text="System checks completed. Ready to initialize project.")
         else:
-            self.update_status(f"Unsupported operating system: {platform.system()}")
-            return False
+            self.git_label.config(text="✗ Git not found", foreground="red")
+            self.system_status_label.config(text="✗ Not Ready", foreground="red")
+            self.status_label.config(text="Please install Git to continue")
+        self.git_installed = results['git_installed']
+        self.validate_inputs()  # Re-validate after git check
+        if self.system_checks_ready_time is None:
+            self.system_checks_ready_time = time.perf_counter()
+            self.system_checks_from_cache = from_cache
     
     def check_git_async(self):
-        """Check Git installation asynchronously."""
+        """Check OS and Git installation asynchronously, refreshing the on-disk cache."""
         def check():
-            # Check OS first
-            os_type = self.get_os_type()
-            os_name = platform.system()
-            self.root.after(0, lambda: self.os_label.config(text=f"{os_name} ({os_type})"))
+            import shutil
+            git_path = shutil.which('git')
+            system = self.session.check_system(refresh=True)
+            results = {
+                'path_env': os.environ.get('PATH', ''),
+                'git_backend': self.git_backend_name,
+                'git_path': git_path,
+                'git_mtime_ns': get_file_mtime_ns(git_path),
+                'os_name': system.os_name,
+                'os_type': system.os_type,
+                'git_installed': system.git_available,
+            }
+            save_system_checks(results)
             
-            # Then check Git
-            if self.check_git_installed():
-                self.root.after(0, lambda: self.git_label.config(text="✓ Git is installed", foreground="green"))
-                self.root.after(0, lambda: self.system_status_label.config(text="✓ Ready", foreground="green"))
-                self.root.after(0, lambda: self.status_label.config(text="System checks completed. Ready to initialize project."))
-                self.root.after(0, lambda: setattr(self, 'git_installed', True))
-                self.root.after(0, lambda: self.validate_inputs())  # Re-validate after git check
-                # Force update to ensure button is visible
-                self.root.after(0, lambda: self.root.update_idletasks())
+            def apply():
+                cached = self.system_checks
+                if cached is None or any(cached.get(k) != v for k, v in results.items()):
+                    self.apply_system_checks(results)
+            self.root.after(0, apply)
+            if results['git_installed']:
                 print("Git check completed - Initialize button should now be enabled")
-            else:
-                self.root.after(0, lambda: self.git_label.config(text="✗ Git not found", foreground="red"))
-                self.root.after(0, lambda: self.system_status_label.config(text="✗ Not Ready", foreground="red"))
-                self.root.after(0, lambda: self.status_label.config(text="Please install Git to continue"))
-                self.root.after(0, lambda: setattr(self, 'git_installed', False))
-                self.root.after(0, lambda: self.validate_inputs())  # Re-validate after git check
         
         thread = threading.Thread(target=check, daemon=True)
         thread.start()
     
     def check_git_installed(self):
         """Check if git is installed and available in PATH."""
-        try:
-            subprocess.run(['git', '--version'], check=True, capture_output=True)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        return self.session.check_system(refresh=True).git_available
     
     def check_repository_accessible(self, repo_url):
         """Check if the repository URL is accessible."""
         try:
             # Try to get repository info without cloning
-            result = subprocess.run(['git', 'ls-remote', '--heads', repo_url], 
-                                  capture_output=True, text=True, timeout=30)
-            if result.returncode == 0 and result.stdout.strip():
+            if self.session.git_backend.ls_remote(repo_url, timeout=30):
                 return True, None
             else:
-                return False, result.stderr
-        except subprocess.TimeoutExpired:
-            return False, "Timeout: Repository access took too long"
+                return False, "Repository has no branches"
+        except load_engine().GitBackendError as e:
+            return False, e.stderr or str(e)
         except Exception as e:
             return False, str(e)
-    
-    def get_os_type(self):
-        """Determine the operating system type."""
-        system = platform.system().lower()
-        if system == "windows":
-            return "windows"
-        elif system in ["linux", "darwin"]:  # darwin is macOS
-            return "unix"
-        else:
-            return "unknown"
 
 
 def main():
     """Main function to start the GUI application."""
+    parser = argparse.ArgumentParser(description="Project Initializer - GUI Version")
+    parser.add_argument(
+        '--git-backend',
+        choices=['dulwich', 'subprocess', 'auto'],  # project_initializer.GIT_BACKENDS, not imported yet
+        default='subprocess',
+        help='Git implementation to use: the git command line tool (default), '
+             'in-process dulwich, or auto (dulwich if installed)'
+    )
+    parser.add_argument(
+        '--cache-dir',
+        help='Cache the template in this directory and copy it from there (verified against '
+             'an integrity manifest) instead of cloning over the network each time'
+    )
+    parser.add_argument(
+        '--mirror',
+        action='append',
+        default=[],
+        metavar='URL',
+        help='Additional mirror of the template repository (repeatable). All mirrors are probed '
+             'concurrently and the template is cloned from the fastest one'
+    )
+    parser.add_argument(
+        '--measure-startup',
+        action='store_true',
+        help='Print the time to the first frame and to an interactive Initialize button, then exit'
+    )
+    args = parser.parse_args()
+    
     root = tk.Tk()
-    app = ProjectInitializerGUI(root)
+    app = ProjectInitializerGUI(root, args.git_backend, args.cache_dir, args.mirror)
     
     # Center the window
     root.update_idletasks()
@@ -477,6 +555,22 @@ def main():
     y = (root.winfo_screenheight() // 2) - (root.winfo_height() // 2)
     root.geometry(f"+{x}+{y}")
     
+    if args.measure_startup:
+        root.update()
+        first_frame = time.perf_counter() - STARTUP_TIME
+        
+        def report_startup():
+            if app.system_checks_ready_time is None:
+                root.after(5, report_startup)
+                return
+            interactive = max(app.system_checks_ready_time - STARTUP_TIME, first_frame)
+            source = "cached" if app.system_checks_from_cache else "fresh"
+            print(f"Time to first frame: {first_frame * 1000:.1f} ms")
+            print(f"Time to first interactive frame: {interactive * 1000:.1f} ms ({source} system checks)")
+            root.destroy()
+        
+        root.after(0, report_startup)
+    
     root.mainloop()
 
 
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Tests for the template mirror race
+Runs race_mirrors() against local file:// repositories, with a stand-in
+backend that delays chosen mirrors. Run with `python -m unittest` or pytest.
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from project_initializer import GitBackendError, MirrorLatencyStore, SubprocessGitBackend, race_mirrors
+
+
+def create_repository(path, commits):
+    """Create a git repository with the given number of commits and return its file:// URL and HEAD."""
+    os.makedirs(path)
+    git = ['git', '-c', 'user.name=test', '-c', 'user.email=test@localhost']
+    subprocess.run(git + ['init', '-q'], cwd=path, check=True)
+    for i in range(commits):
+        with open(os.path.join(path, 'README.md'), 'w') as f:
+            f.write(f"revision {i}\n")
+        subprocess.run(git + ['add', '.'], cwd=path, check=True)
+        subprocess.run(git + ['commit', '-q', '-m', f"revision {i}"], cwd=path, check=True)
+    head = subprocess.run(git + ['rev-parse', 'HEAD'], cwd=path, check=True,
+                          capture_output=True, text=True).stdout.strip()
+    return Path(path).as_uri(), head
+
+
+class DelayedGitBackend(SubprocessGitBackend):
+    """Stand-in for slow mirrors: ls-remote of a delayed URL answers only after its delay."""
+
+    def __init__(self, delays):
+        super().__init__()
+        self.delays = delays
+        self.probed = []
+        self.cancelled = threading.Event()
+
+    def ls_remote(self, repo_url, timeout=None, cancel_event=None):
+        self.probed.append(repo_url)
+        delay = self.delays.get(repo_url)
+        if delay and cancel_event.wait(delay):
+            self.cancelled.set()
+            raise GitBackendError(f"ls-remote of {repo_url} was cancelled")
+        return super().ls_remote(repo_url, timeout, cancel_event)
+
+
+class RaceMirrorsTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.mkdtemp()
+        cls.slow_url, cls.slow_head = create_repository(os.path.join(cls.tmp, 'slow'), 2)
+        cls.fast_url, cls.fast_head = create_repository(os.path.join(cls.tmp, 'fast'), 2)
+        cls.stale_url, cls.stale_head = create_repository(os.path.join(cls.tmp, 'stale'), 1)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmp, ignore_errors=True)
+
+    def test_fast_mirror_wins_and_delayed_probe_is_cancelled(self):
+        backend = DelayedGitBackend({self.slow_url: 30})
+        start = time.monotonic()
+        result = race_mirrors([self.slow_url, self.fast_url], backend, stagger=0.05)
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertEqual(result.url, self.fast_url)
+        self.assertEqual(result.commit, self.fast_head)
+        self.assertEqual(backend.probed, [self.slow_url, self.fast_url])
+        self.assertTrue(backend.cancelled.wait(5), "delayed probe was not cancelled")
+
+    def test_stale_mirror_is_rejected(self):
+        backend = DelayedGitBackend({self.fast_url: 0.2})
+        result = race_mirrors([self.stale_url, self.fast_url], backend,
+                              expected_commit=self.fast_head[:12], stagger=0.05)
+        self.assertEqual(result.url, self.fast_url)
+        self.assertEqual([url for url, _ in result.failures], [self.stale_url])
+        self.assertIn("expected", str(result.failures[0][1]))
+
+    def test_all_mirrors_failing_raises(self):
+        missing = [Path(self.tmp, name).as_uri() for name in ('missing-a', 'missing-b')]
+        store = MirrorLatencyStore(os.path.join(self.tmp, 'failing.json'))
+        with self.assertRaises(GitBackendError) as raised:
+            race_mirrors(missing, DelayedGitBackend({}), latency_store=store, stagger=0.05)
+        for url in missing:
+            self.assertIn(url, str(raised.exception))
+            self.assertGreater(store.latencies[url], 1)
+
+    def test_race_gives_up_at_its_deadline(self):
+        backend = DelayedGitBackend({self.slow_url: 30, self.fast_url: 30})
+        start = time.monotonic()
+        with self.assertRaises(GitBackendError) as raised:
+            race_mirrors([self.slow_url, self.fast_url], backend, stagger=0.05, deadline=0.3)
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertIn("within 0.3s", str(raised.exception))
+        self.assertTrue(backend.cancelled.wait(5), "hung probes were not cancelled")
+
+    def test_remembered_latency_reorders_probes(self):
+        path = os.path.join(self.tmp, 'mirrors.json')
+        store = MirrorLatencyStore(path)
+        store.record(self.slow_url, 5.0)
+        store.record(self.fast_url, 0.01)
+        self.assertEqual(store.order([self.slow_url, self.fast_url]), [self.fast_url, self.slow_url])
+
+        # The fast mirror is probed first and answers before the stagger, so the slow one is never probed
+        backend = DelayedGitBackend({self.slow_url: 30})
+        result = race_mirrors([self.slow_url, self.fast_url], backend, latency_store=store, stagger=5)
+        self.assertEqual(result.url, self.fast_url)
+        self.assertEqual(backend.probed, [self.fast_url])
+
+        reloaded = MirrorLatencyStore(path)
+        self.assertEqual(reloaded.latencies[self.slow_url], 5.0)
+        self.assertLess(reloaded.latencies[self.fast_url], 5.0)
+
+        # A failure moves a mirror behind the others
+        reloaded.record(self.fast_url, None)
+        reloaded.record(self.fast_url, None)
+        reloaded.record(self.fast_url, None)
+        self.assertEqual(reloaded.order([self.fast_url, self.slow_url]), [self.slow_url, self.fast_url])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Tests for the clone and bootstrap watchdog
+Runs run_with_watchdog() against small shell commands, and a session clone
+against a local repository that fails once. Run with `python -m unittest`
+or pytest.
+"""
+
+import os
+import shutil
+import signal
+import tempfile
+import time
+import unittest
+
+from project_initializer import (READER_DRAIN_SECONDS, GitBackendError, Initializer, PhaseLimits,
+                                 SubprocessGitBackend, WatchdogTimeout, run_with_watchdog)
+from test_race_mirrors import create_repository
+
+
+def process_alive(pid):
+    """Return True if pid is a running process (zombies waiting to be reaped do not count)."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    try:
+        with open(f'/proc/{pid}/stat') as f:
+            return f.read().rsplit(')', 1)[1].split()[0] != 'Z'
+    except OSError:
+        return True
+
+
+def wait_for_exit(pid, timeout=5):
+    """Return True once pid is gone, or False if it is still running after timeout seconds."""
+    deadline = time.monotonic() + timeout
+    while process_alive(pid):
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.05)
+    return True
+
+
+@unittest.skipIf(os.name == 'nt', "uses sh and POSIX process groups")
+class RunWithWatchdogTest(unittest.TestCase):
+
+    def test_stall_kills_the_whole_process_group(self):
+        output = []
+        start = time.monotonic()
+        with self.assertRaises(WatchdogTimeout) as raised:
+            run_with_watchdog(['sh', '-c', 'sleep 100 & echo $!; sleep 100'],
+                              PhaseLimits(stall_timeout=0.5), on_output=output.append)
+        self.assertEqual(raised.exception.reason, 'stall')
+        self.assertLess(time.monotonic() - start, 5)
+        background = int(''.join(output))
+        self.assertTrue(wait_for_exit(background), "background sleep survived the stall")
+
+    def test_deadline_fires(self):
+        start = time.monotonic()
+        with self.assertRaises(WatchdogTimeout) as raised:
+            run_with_watchdog(['sh', '-c', 'while true; do echo tick; sleep 0.05; done'],
+                              PhaseLimits(deadline=0.5, stall_timeout=10))
+        self.assertEqual(raised.exception.reason, 'deadline')
+        self.assertLess(time.monotonic() - start, 5)
+
+    def test_background_process_holding_the_pipe_does_not_block(self):
+        start = time.monotonic()
+        result = run_with_watchdog(['sh', '-c', '(sleep 8 & echo $! >&2); echo done'])
+        elapsed = time.monotonic() - start
+        background = int(result.stderr)
+        self.addCleanup(os.kill, background, signal.SIGKILL)
+        self.assertLess(elapsed, READER_DRAIN_SECONDS)
+        self.assertEqual(result.stdout, 'done\n')
+        self.assertTrue(process_alive(background), "test needs the background sleep to outlive the child")
+
+
+class FlakyGitBackend(SubprocessGitBackend):
+    """Stand-in for a flaky network: the first clone fails after leaving a partial checkout behind."""
+
+    def __init__(self):
+        super().__init__()
+        self.clones = 0
+
+    def clone(self, repo_url, target_dir, bare=False):
+        self.clones += 1
+        if self.clones == 1:
+            os.makedirs(target_dir)
+            open(os.path.join(target_dir, 'partial'), 'w').close()
+            raise GitBackendError(f"Cloning {repo_url} failed: connection reset")
+        super().clone(repo_url, target_dir, bare)
+
+
+class CloneRetryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp, True)
+        self.template_url, self.template_head = create_repository(os.path.join(self.tmp, 'template'), 1)
+
+    def test_failed_clone_is_retried_and_recorded(self):
+        backend = FlakyGitBackend()
+        env = dict(os.environ, GIT_AUTHOR_NAME='test', GIT_AUTHOR_EMAIL='test@localhost',
+                   GIT_COMMITTER_NAME='test', GIT_COMMITTER_EMAIL='test@localhost')
+        session = Initializer(repo_url=self.template_url, git_backend=backend, retries=1, env=env)
+        result = session.initialize('project', self.tmp, bootstrap=False)
+
+        self.assertTrue(result.success, result.error)
+        self.assertEqual(backend.clones, 2)
+        self.assertEqual(len(result.retries), 1)
+        self.assertEqual(result.retries[0].phase, 'clone')
+        self.assertIn("connection reset", str(result.retries[0].error))
+        self.assertEqual(result.commit, self.template_head)
+        self.assertFalse(os.path.exists(os.path.join(self.tmp, 'project', 'partial')))
+
+
+if __name__ == "__main__":
+    unittest.main()